@@ -24,6 +24,7 @@ from __future__ import annotations
 
 # first-party
 from datetime import datetime
+from functools import partial
 from io import BytesIO, StringIO
 from os import name
 from typing import Type, Any, Iterator, TYPE_CHECKING, Sequence
@@ -46,6 +47,8 @@ from ..exception import (
 from ..handler import URI
 from ..mimetype import LibraryMimeTyper
 from ..pipelines import Pipeline
+from ..pipelines.comparer import Comparer
+from ..pipelines.hasher import Hasher
 from ..serializer import JSONSerializer
 from ..storage import LinuxFileSystem, WindowsFileSystem
 
@@ -171,13 +174,13 @@ class BaseFile:
     non-blocking and errors that occur in it will be available through attribute `errors` at 
     `extract_data_pipeline.errors`.
     """
-    compare_pipeline: Pipeline = Pipeline(
+    compare_pipeline: Pipeline = Pipeline(*Comparer.order_by_cost(
         'filez.pipelines.comparer.TypeCompare',
         'filez.pipelines.comparer.SizeCompare',
         'filez.pipelines.comparer.BinaryCompare',
         'filez.pipelines.comparer.HashCompare',
         'filez.pipelines.comparer.DataCompare'
-    )
+    ))
     """
     Pipeline to compare two files.
     """
@@ -537,11 +540,15 @@ class BaseFile:
     def content_as_iterator(self) -> Iterator[Sequence[object]] | None:
         """
         Method to return as an attribute the content that was previous loaded as a buffer.
+        The content is iterated in blocks of the content`s block size instead of lines, as binary content may have
+        very long or very short lines. The sentinel is an empty value of the same type as the content.
         """
         if self._content is None:
             return None
 
-        return iter(self._content.content_as_buffer)
+        buffer: BytesIO | StringIO = self._content.content_as_buffer
+
+        return iter(partial(buffer.read, self._content._block_size), buffer.read(0))
 
     @property
     def content_as_buffer(self) -> BytesIO | StringIO | None:
@@ -743,6 +750,13 @@ class BaseFile:
          (currently the search in LibraryMimeTyper() regards of checking extension for mimetype or checking extension
          in all extensions is similar in complexity).
         """
+        # Split the filename from the extension once. A complete filename without dot, or with only a leading one,
+        # has no extension to be validated.
+        filename, _, maybe_extension = complete_filename.rpartition('.')
+
+        if not filename or not maybe_extension:
+            return False
+
         # Check if there is known extension in complete_filename.
         # This method break extract extension from filename and get check if it is valid, returning
         # extension only if it is registered.
@@ -755,18 +769,15 @@ class BaseFile:
                 if possible_extension not in self.mime_type_handler.get_extensions(self.mime_type):
                     return False
 
-            # Use first class Renamer declared in pipeline because `prepare_filename` is a class method from base
-            # Renamer class, and we don't require any other specialized methods from Renamer children.
-            self.complete_filename_as_tuple = self.rename_pipeline[0].prepare_filename(
-                complete_filename,
-                possible_extension
-            )
+            # The filename was already split from the extension, so it is not required to remove the extension from
+            # complete_filename again.
+            self.complete_filename_as_tuple = (filename, possible_extension)
 
             # Save additional metadata to file.
             if self.extension:
-                self._meta.compressed = self.mime_type_handler.is_extension_compressed(self.extension)
-                self._meta.lossless = self.mime_type_handler.is_extension_lossless(self.extension)
-                self._meta.packed = self.mime_type_handler.is_extension_packed(self.extension)
+                self._meta.compressed, self._meta.lossless, self._meta.packed = (
+                    self.mime_type_handler.classify_extension(self.extension)
+                )
 
             if self._meta.packed:
                 self._actions.to_list()
@@ -837,6 +848,17 @@ class BaseFile:
             for processor in self.hasher_pipeline:
                 processor.parameters['try_loading_from_file'] = try_loading_from_file
 
+            if not try_loading_from_file:
+                # All hashes will be generated from content, so we read it once for all hashers of the pipeline
+                # instead of once per hasher, mapping it to memory when possible.
+                Hasher.generate_hashes(
+                    object_to_process=self,
+                    hashers=[
+                        processor.classname for processor in self.hasher_pipeline
+                        if issubclass(processor.classname, Hasher)
+                    ]
+                )
+
             self.hasher_pipeline.run(object_to_process=self)
 
             self._actions.hashed()
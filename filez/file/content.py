@@ -61,9 +61,10 @@ class FileContent:
     """
     Variable to work as shortcut for the current related object for the hashes and other data.
     """
-    _block_size: int = 256
+    _block_size: int = 1 << 20
     """
-    Block size of file to be loaded in each step of iterator.
+    Block size of file to be loaded in each step of iterator. Larger blocks reduce the amount of reads to the
+    operating system and of iterations in Python.
     """
     _buffer_encoding: str = 'utf-8'
     """
@@ -22,7 +22,7 @@ Should there be a need for contact the electronic mail
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Iterator, Type, Any
+from typing import TYPE_CHECKING, Iterator, KeysView, Type, Any
 
 from ..exception import ImproperlyConfiguredFile, SerializerError, ValidationError
 
@@ -96,6 +96,13 @@ class FileHashes:
         """
         return self._cache[hasher_name]
 
+    def __contains__(self, hasher_name: str) -> bool:
+        """
+        Method to check if there is a hash saved in self._cache for the hasher, looking it up directly instead of
+        iterating through `__iter__`.
+        """
+        return hasher_name in self._cache
+
     def __iter__(self) -> Iterator:
         """
         Method to return iterable from self._cache instead of current class.
@@ -117,11 +124,22 @@ class FileHashes:
 
         return {key: getattr(self, key) for key in attributes}
 
-    def keys(self) -> set:
+    def get(
+        self,
+        hasher_name: str,
+        default: tuple[str, BaseFile, Type[Hasher]] | None = None
+    ) -> tuple[str, BaseFile, Type[Hasher]] | None:
+        """
+        Method to get the hasher value and file associated saved in self._cache, or `default` if there is none.
+        """
+        return self._cache.get(hasher_name, default)
+
+    def keys(self) -> KeysView[str]:
         """
         Method to return the keys availabke at `_cache`.
+        The view supports set operations like `&` without copying the keys.
         """
-        return set(self._cache.keys())
+        return self._cache.keys()
 
     def rename(self, new_filename) -> None:
         """
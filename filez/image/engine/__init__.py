@@ -22,11 +22,16 @@ Should there be a need for contact the electronic mail
 """
 from __future__ import annotations
 
-import base64
 import warnings
 from io import BytesIO, StringIO
 from typing import Any, Type
 
+try:
+    # pybase64 is optional, it encodes using SIMD instructions being much faster for the content of large images.
+    from pybase64 import b64encode
+except ImportError:
+    from base64 import b64encode
+
 __all__ = [
     "ImageEngine",
 ]
@@ -35,9 +40,11 @@ __all__ = [
 class ImageEngine:
     """
     Class that standardized methods of different image manipulators.
+    Instance attributes are declared in `__slots__`, so child classes should declare their own `__slots__` too.
     """
+    __slots__ = ("image", "metadata", "size_hint", "source_buffer")
+
     image: Any
-    image = None
     """
     Attribute where the current image converted from buffer is stored.
     """
@@ -46,18 +53,26 @@ class ImageEngine:
     Attribute used to store the class reference responsible to create an image.
     This attribute should be override by child class.
     """
-    metadata: dict[str, Any]
-    metadata = None
+    metadata: dict[str, Any] | None
     """
     Attribute used to store image metadata if available.
     """
+    size_hint: tuple[int, int] | None
+    """
+    Attribute used to store the size (width, height) that the image is expected to be scaled down to. Engines that
+    support it can use this value to decode a reduced version of the image that is still bigger than the hint.
+    """
 
-    def __init__(self, buffer: StringIO | BytesIO) -> None:
+    def __init__(self, buffer: StringIO | BytesIO, size_hint: tuple[int, int] | None = None) -> None:
         """
         Method to instantiate the current class using a buffer for the image content as a source
         for manipulation by the class to be used.
         """
+        # Slots have no default value, so all of them are set before preparing the image.
+        self.image = None
+        self.metadata = None
         self.source_buffer = buffer
+        self.size_hint = size_hint
 
         if buffer:
             self.prepare_image()
@@ -129,11 +144,13 @@ class ImageEngine:
         content = self.get_bytes(encode_format)
 
         # Convert buffer to base64 string representation in ASCII
-        return base64.b64encode(content).decode('ascii')
+        return b64encode(content).decode('ascii')
 
     def get_buffer(self, encode_format: str = "jpeg") -> BytesIO:
         """
         Method to get a buffer IO from the current image.
+        Child classes that encode to a buffer should override this method to return it directly. Creating BytesIO from
+        `bytes` shares its memory until the buffer is written to, so no copy is made here for engines returning bytes.
         """
         return BytesIO(self.get_bytes(encode_format=encode_format))
 
@@ -157,20 +174,20 @@ class ImageEngine:
         Method to obtain a new size relative to width and height that respect the aspect ratio
         keeping it constraining to new_width and new_height or not.
         """
-        # Get current ratio from width and height.
-        ratio = self.get_aspect_ratio(width, height)
-
-        # Use ratio to get new size keep or not the new size constraining to new values.
+        # Use proportion to get new size keep or not the new size constraining to new values.
+        # Integer arithmetic keeps the side used as reference exact, without the truncation of float ratios.
         if (constraint and width < height) or (not constraint and width >= height):
-            a = 1
-            b = ratio[0]
-            size = new_height
-        else:
-            a = ratio[1]
-            b = 1
-            size = new_width
+            return new_height * width // height, new_height
 
-        return int(ratio[0] * a * size), int(b * ratio[1] * size)
+        return new_width, new_width * height // width
+
+    @staticmethod
+    def get_resample_steps(total_frames: int, percentual: int) -> int:
+        """
+        Method to obtain the step between frames kept when re sampling an image sequence with only the percentual
+        amount of items. At least the first frame is always kept.
+        """
+        return total_frames // max(total_frames * percentual // 100, 1)
 
     def get_size(self) -> tuple[int, int]:
         """
@@ -239,8 +256,8 @@ class ImageEngine:
 
         elif crop:
             # Resize image cropping it to have the same aspect ratio as the new width and height.
-            ratio_width, ratio_height = self.get_aspect_ratio(width, height)
-            self.crop(int(ratio_width * current_height), int(ratio_height * current_width))
+            # Integer arithmetic is used instead of `get_aspect_ratio` to avoid the float ratios.
+            self.crop(width * current_height // height, height * current_width // width)
 
         # Scale image with the new width, height
         self.scale(width, height)
@@ -22,7 +22,8 @@ Should there be a need for contact the electronic mail
 """
 from __future__ import annotations
 
-from typing import Any
+from types import MappingProxyType
+from typing import Any, ClassVar, Mapping
 
 import cv2
 import numpy as np
@@ -41,6 +42,95 @@ class OpenCVImage(ImageEngine):
     This class depends on OpenCV being installed in the system.
     In OpenCV the image is basically a numpy matrix.
     """
+    __slots__ = ()
+
+    colorschemes: ClassVar[Mapping[str, int]] = MappingProxyType({
+        "gray": cv2.COLOR_BGR2GRAY,
+        "Lab": cv2.COLOR_BGR2LAB,
+        "YCrCb": cv2.COLOR_BGR2YCrCb,
+        "HSV": cv2.COLOR_BGR2HSV
+    })
+    """
+    Attribute used to store the conversion code of OpenCV for each color space available to `change_color`.
+    """
+    encode_extensions: ClassVar[Mapping[str, str]] = MappingProxyType({
+        "jpeg": ".jpg",
+        "png": ".png",
+        "webp": ".webp"
+    })
+    """
+    Attribute used to store the extension used by OpenCV to identify the encoder for each format available to
+    `get_bytes`.
+    """
+    reduced_decode_flags: tuple[tuple[int, int, int], ...] = (
+        (8, cv2.IMREAD_REDUCED_GRAYSCALE_8, cv2.IMREAD_REDUCED_COLOR_8),
+        (4, cv2.IMREAD_REDUCED_GRAYSCALE_4, cv2.IMREAD_REDUCED_COLOR_4),
+        (2, cv2.IMREAD_REDUCED_GRAYSCALE_2, cv2.IMREAD_REDUCED_COLOR_2),
+    )
+    """
+    Attribute used to store the reduction factors, from the biggest to the lowest, with its flags for single channel
+    and color images available to decode a JPEG already scaled down.
+    """
+
+    @staticmethod
+    def _get_jpeg_header(content: bytes) -> tuple[int, int, int] | None:
+        """
+        Method to obtain the width, height and amount of components of JPEG content from its frame header without
+        decoding it. This method will return None if content is not a JPEG or no frame header was found.
+        """
+        if content[:2] != b'\xff\xd8':
+            return None
+
+        index: int = 2
+        length: int = len(content)
+
+        while index + 9 < length:
+            if content[index] != 0xFF:
+                return None
+
+            marker: int = content[index + 1]
+
+            if marker == 0xFF:
+                # Fill byte before marker.
+                index += 1
+                continue
+
+            # Start of frame markers, excluding DHT, JPG and DAC that share the same range.
+            if 0xC0 <= marker <= 0xCF and marker not in {0xC4, 0xC8, 0xCC}:
+                height: int = int.from_bytes(content[index + 5:index + 7], 'big')
+                width: int = int.from_bytes(content[index + 7:index + 9], 'big')
+
+                return width, height, content[index + 9]
+
+            # Skip segment using its length that includes the two bytes of length itself.
+            index += 2 + int.from_bytes(content[index + 2:index + 4], 'big')
+
+        return None
+
+    def _get_decode_flag(self, content: bytes) -> int:
+        """
+        Method to obtain the flag for decoding the content. When `size_hint` is set and content is a JPEG
+        without alpha channel, the flag returned will decode the image with the biggest reduction that still
+        keeps it bigger than the hint, letting libjpeg skip most of the decoding work.
+        """
+        if not self.size_hint:
+            return cv2.IMREAD_UNCHANGED
+
+        header: tuple[int, int, int] | None = self._get_jpeg_header(content)
+
+        # Only grayscale and color JPEG keep the same channels as `IMREAD_UNCHANGED` when decoded reduced.
+        if not header or header[2] not in {1, 3}:
+            return cv2.IMREAD_UNCHANGED
+
+        width, height, components = header
+        hint_width, hint_height = self.size_hint
+
+        for factor, grayscale_flag, color_flag in self.reduced_decode_flags:
+            if width // factor >= hint_width and height // factor >= hint_height:
+                # Orientation is ignored to behave the same as `IMREAD_UNCHANGED`.
+                return (grayscale_flag if components == 1 else color_flag) | cv2.IMREAD_IGNORE_ORIENTATION
+
+        return cv2.IMREAD_UNCHANGED
 
     def append_to_sequence(self, images: list[Any], **kwargs: Any) -> None:
         """
@@ -53,15 +143,7 @@ class OpenCVImage(ImageEngine):
         """
         Method to change the color space of the current image.
         """
-        # Convert to grey scale
-        colorscheme: dict[str, int] = {
-            "gray": cv2.COLOR_BGR2GRAY,
-            "Lab": cv2.COLOR_BGR2LAB,
-            "YCrCb": cv2.COLOR_BGR2YCrCb,
-            "HSV": cv2.COLOR_BGR2HSV
-        }
-
-        self.image = cv2.cvtColor(self.image, colorscheme[colorspace])
+        self.image = cv2.cvtColor(self.image, self.colorschemes[colorspace])
 
     def clone(self) -> Any:
         """
@@ -81,16 +163,18 @@ class OpenCVImage(ImageEngine):
         # Set `left` based on center gravity
         left: int = current_width // 2 - width // 2
 
-        self.image = self.image[top:top+height, left:left+width]
+        # Slicing columns results in a view with the stride of the original image, so we copy it to a contiguous
+        # matrix to keep OpenCV operations in their fast path and to release the original image.
+        self.image = np.ascontiguousarray(self.image[top:top+height, left:left+width])
 
     def get_bytes(self, encode_format: str = "jpeg") -> bytes | ndarray:
         """
         Method to obtain the bytes' representation for the content of the current image object.
         """
-        formats: dict[str, str] = {
-            "jpeg": ".jpg"
-        }
-        success, buffer = cv2.imencode(formats[encode_format], self.image)
+        try:
+            success, buffer = cv2.imencode(self.encode_extensions[encode_format], self.image)
+        except KeyError:
+            raise ValueError(f"Format {encode_format} is not supported in OpenCVImage.get_bytes_from_image.")
 
         if not success:
             raise ValueError(f"Could not convert image to format {encode_format} in OpenCVImage.get_bytes_from_image.")
@@ -113,17 +197,22 @@ class OpenCVImage(ImageEngine):
     def has_transparency(self) -> bool:
         """
         Method to verify if image has a channel for transparency.
+        Grayscale images without alpha are decoded as a matrix of two dimensions, so they have no channel in shape.
         """
-        return self.image.shape[2] > 3 or self.image.shape[2] == 2
+        shape: tuple[int, ...] = self.image.shape
+
+        return len(shape) > 2 and (shape[2] > 3 or shape[2] == 2)
 
     def prepare_image(self) -> None:
         """
         Method to prepare the image using the stored buffer as the source.
         """
+        content: bytes = self.source_buffer.read()
+
         # convert to numpy array
-        array = np.asarray(bytearray(self.source_buffer.read()), dtype="uint8")
+        array = np.asarray(bytearray(content), dtype="uint8")
 
-        self.image = cv2.imdecode(array, cv2.IMREAD_UNCHANGED)
+        self.image = cv2.imdecode(array, self._get_decode_flag(content))
 
     def resample(self, percentual: int = 10, encode_format: str = "webp") -> None:
         """
@@ -136,8 +225,17 @@ class OpenCVImage(ImageEngine):
     def scale(self, width: int, height: int, **kwargs: Any) -> None:
         """
         Method to scale the current image object without implementing additional logic.
+        Area interpolation is only used when shrinking, as it is the slower path when enlarging the image.
         """
-        self.image = cv2.resize(self.image, (width, height), interpolation=cv2.INTER_AREA)
+        current_width, current_height = self.get_size()
+
+        interpolation: int = (
+            cv2.INTER_AREA
+            if width * height < current_width * current_height
+            else cv2.INTER_LINEAR_EXACT
+        )
+
+        self.image = cv2.resize(self.image, (width, height), interpolation=interpolation)
 
     def show(self) -> None:
         """
@@ -153,13 +251,9 @@ class OpenCVImage(ImageEngine):
         The parameter color is used to indicate the color to trim else it will use transparency.
         """
         if color:
-            # Create new image with same color
-            background: ndarray = np.zeros(self.image.shape, np.uint8)
-
-            if self.has_transparency():
-                background[:] = tuple([*color, 255])
-            else:
-                background[:] = color
+            # Use the color as a scalar of four values instead of creating a new image with same color, so no
+            # array of the image size is allocated for the background. The fourth value is ignored without alpha.
+            background: ndarray = np.array([*color, 255 if self.has_transparency() else 0], dtype=np.float64)
 
             diff = cv2.absdiff(self.image, background)
 
@@ -169,8 +263,10 @@ class OpenCVImage(ImageEngine):
             bounding_border = cv2.boundingRect(diff)
 
         elif self.has_transparency():
-            splitted_channels = cv2.split(self.image)
-            bounding_border = cv2.boundingRect(splitted_channels[-1])
+            # Copy only the alpha channel, as `boundingRect` requires a contiguous single channel, instead of
+            # splitting all channels of image.
+            alpha_channel: ndarray = np.ascontiguousarray(self.image[..., -1])
+            bounding_border = cv2.boundingRect(alpha_channel)
 
         else:
             raise ValueError("Cannot trim image because no color was informed and no alpha channel exists in the "
@@ -178,5 +274,8 @@ class OpenCVImage(ImageEngine):
 
         if bounding_border:
             # bounding_border is equal to `x, y, w, h = bounding_border`
-            self.image = self.image[bounding_border[1]:bounding_border[3], bounding_border[0]:bounding_border[2]]
+            # Keep the image contiguous, the same as in `crop`.
+            self.image = np.ascontiguousarray(
+                self.image[bounding_border[1]:bounding_border[3], bounding_border[0]:bounding_border[2]]
+            )
 
@@ -23,9 +23,13 @@ Should there be a need for contact the electronic mail
 from __future__ import annotations
 
 from io import BytesIO
-from typing import Any, Type, Iterator
+from itertools import islice
+from types import MappingProxyType
+from typing import Any, ClassVar, Mapping, Type
 
-from PIL import Image as PillowImageClass, ImageChops, ImageSequence as PillowSequence
+import numpy as np
+from numpy import ndarray
+from PIL import Image as PillowImageClass, ImageSequence as PillowSequence
 
 from . import ImageEngine
 
@@ -38,11 +42,21 @@ class PillowImage(ImageEngine):
     """
     Class that standardized methods of Pillow library.
     """
+    __slots__ = ()
 
     class_image: Type[PillowImageClass] = PillowImageClass
     """
     Attribute used to store the class reference responsible to create an image.
     """
+    colorschemes: ClassVar[Mapping[str, str]] = MappingProxyType({
+        "gray": "L",
+        "Lab": "",
+        "YCrCb": "",
+        "HSV": ""
+    })
+    """
+    Attribute used to store the mode of Pillow for each color space available to `change_color`.
+    """
 
     def _set_image_sequence(self, images: list[Any], encode_format: str) -> None:
         """
@@ -75,23 +89,18 @@ class PillowImage(ImageEngine):
         """
         encode_format: str = kwargs.pop("encode_format", "webp")
 
-        # Convert to grey scale
-        colorscheme: dict[str, str] = {
-            "gray": "L",
-            "Lab": "",
-            "YCrCb": "",
-            "HSV": ""
-        }
+        mode: str = self.colorschemes[colorspace]
+
         if self.has_sequence():
             def change_color_frame(image):
 
-                return image.convert(colorscheme[colorspace])
+                return image.convert(mode)
 
             images = PillowSequence.all_frames(self.image, change_color_frame)
             self._set_image_sequence(images, encode_format)
 
         else:
-            self.image = self.image.convert(colorscheme[colorspace])
+            self.image = self.image.convert(mode)
 
     def clone(self) -> Any:
         """
@@ -130,6 +139,10 @@ class PillowImage(ImageEngine):
         """
         output = BytesIO()
         self.image.save(output, save_all=True, format=encode_format)
+
+        # Reset buffer to beginning so that it can be consumed without seeking it first.
+        output.seek(0)
+
         return output
 
     def get_bytes(self, encode_format: str = "jpeg") -> bytes:
@@ -138,7 +151,9 @@ class PillowImage(ImageEngine):
         """
         output = BytesIO()
         self.image.save(output, format=encode_format)
-        return output.read()
+
+        # Get whole content without the need to seek the buffer and read it as a new copy.
+        return output.getvalue()
 
     def get_size(self) -> tuple[int, int]:
         """
@@ -176,7 +191,7 @@ class PillowImage(ImageEngine):
         if total_frames <= 1:
             return
 
-        steps: int = total_frames // (total_frames * percentual // 100)
+        steps: int = self.get_resample_steps(total_frames, percentual)
 
         duration: int | None
         try:
@@ -187,11 +202,11 @@ class PillowImage(ImageEngine):
 
         images: list = []
 
-        sequence: Iterator = PillowSequence.Iterator(self.image)
-
-        for index in set(range(0, total_frames, steps)):
+        # Walk the sequence only once and in order, because indexing the iterator seeks the image and, for formats
+        # like GIF, seeking requires decoding all previous frames again.
+        for frame in islice(PillowSequence.Iterator(self.image), 0, total_frames, steps):
             # Convert to SingleImage
-            frame = sequence[index].copy()
+            frame = frame.copy()
             # Fix duration
             if duration:
                 frame.info["duration"] = duration
@@ -232,8 +247,24 @@ class PillowImage(ImageEngine):
         This method will trim the whole image based on first frame/size if image has sequence.
         """
         if color:
-            background = self.class_image.new(self.image.mode, self.image.size, color=color)
-            bounding_border = ImageChops.difference(self.image, background).getbbox()
+            # Compute the bounding box directly from the pixels instead of allocating a background image and the
+            # difference image between it and the current one.
+            pixels: ndarray = np.asarray(self.image)
+            pixels = pixels.reshape(pixels.shape[0], pixels.shape[1], -1)
+
+            if pixels.shape[2] > len(color):
+                # Background is considered opaque, same as Pillow does when filling an image with alpha channel.
+                color = (*color, 255)
+
+            mask: ndarray = np.any(pixels != np.asarray(color, dtype=pixels.dtype), axis=2)
+            rows: ndarray = np.flatnonzero(mask.any(axis=1))
+            columns: ndarray = np.flatnonzero(mask.any(axis=0))
+
+            bounding_border = (
+                (int(columns[0]), int(rows[0]), int(columns[-1]) + 1, int(rows[-1]) + 1)
+                if rows.size
+                else None
+            )
         elif self.has_transparency():
             # Trim transparency
             bounding_border = self.image.getchannel("A").getbbox()
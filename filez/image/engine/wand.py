@@ -23,7 +23,8 @@ Should there be a need for contact the electronic mail
 # python internals
 from __future__ import annotations
 
-from typing import Any, Type
+from types import MappingProxyType
+from typing import Any, ClassVar, Mapping, Type
 
 from wand.color import Color
 # Third-party
@@ -43,11 +44,21 @@ class WandImage(ImageEngine):
     Class that standardized methods of Wand library.
     This class depends on Wand being installed in the system.
     """
+    __slots__ = ()
 
     class_image: Type[type] = WandImageClass
     """
     Attribute used to store the class reference responsible to create an image.
     """
+    colorschemes: ClassVar[Mapping[str, str]] = MappingProxyType({
+        "gray": "gray",
+        "Lab": "lab",
+        "YCrCb": "ycbcr",
+        "HSV": "hsv"
+    })
+    """
+    Attribute used to store the color space type of Wand for each color space available to `change_color`.
+    """
 
     def append_to_sequence(self, images: list[Any], **kwargs: Any) -> None:
         """
@@ -61,14 +72,7 @@ class WandImage(ImageEngine):
         """
         Method to change the color space of the current image.
         """
-        colorscheme: dict[str, str] = {
-            "gray": "gray",
-            "Lab": "",
-            "YCrCb": "",
-            "HSV": ""
-        }
-        # Convert to grey scale
-        self.image.transform_colorspace(colorscheme[colorspace])
+        self.image.transform_colorspace(self.colorschemes[colorspace])
 
     def clone(self) -> Any:
         """
@@ -124,10 +128,13 @@ class WandImage(ImageEngine):
 
         total_frames: int = len(self.image.sequence)
 
-        steps: int = total_frames // (total_frames * percentual // 100)
+        steps: int = self.get_resample_steps(total_frames, percentual)
 
-        for index in list(set(range(0, total_frames, 1)) - set(range(0, total_frames, steps)))[::-1]:
-            del self.image.sequence[index]
+        # Remove frames from last to first so that indexes of frames not yet visited are kept valid and no frame
+        # after the removed one needs to be shifted.
+        for index in range(total_frames - 1, 0, -1):
+            if index % steps:
+                del self.image.sequence[index]
 
     def scale(self, width: int, height: int, **kwargs: Any) -> None:
         """
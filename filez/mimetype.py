@@ -24,7 +24,11 @@ Should there be a need for contact the electronic mail
 from __future__ import annotations
 
 import mimetypes
+from functools import lru_cache
 from os.path import dirname, realpath, join
+from sys import intern
+from types import MappingProxyType
+from typing import ClassVar, Mapping
 
 __all__ = [
     'LibraryMimeTyper',
@@ -40,7 +44,7 @@ class BaseMimeTyper:
     """
 
     @property
-    def lossless_mimetypes(self) -> list[str]:
+    def lossless_mimetypes(self) -> frozenset[str]:
         """
         Method to return as attribute the mimetypes that are for lossless encoding.
         This method should be override in child class.
@@ -48,7 +52,7 @@ class BaseMimeTyper:
         raise NotImplementedError("lossless_mimetypes() method must be overwritten on child class.")
 
     @property
-    def lossless_extensions(self) -> list[str]:
+    def lossless_extensions(self) -> frozenset[str]:
         """
         Method to return as attribute the extensions that are for lossless encoding.
         This method should be override in child class.
@@ -56,7 +60,7 @@ class BaseMimeTyper:
         raise NotImplementedError("lossless_extensions() method must be overwritten on child class.")
 
     @property
-    def compressed_mimetypes(self) -> list[str]:
+    def compressed_mimetypes(self) -> frozenset[str]:
         """
         Method to return as attribute the mimetypes that are for containers of compression.
         This method should be override in child class.
@@ -64,7 +68,7 @@ class BaseMimeTyper:
         raise NotImplementedError("compressed_mimetypes() method must be overwritten on child class.")
 
     @property
-    def compressed_extensions(self) -> list[str]:
+    def compressed_extensions(self) -> frozenset[str]:
         """
         Method to return as attribute the extensions that are for containers of compression.
         This method should be override in child class.
@@ -72,14 +76,14 @@ class BaseMimeTyper:
         raise NotImplementedError("compressed_extensions() method must be overwritten on child class.")
 
     @property
-    def packed_extensions(self) -> list[str]:
+    def packed_extensions(self) -> frozenset[str]:
         """
         Method to return as attribute the extensions that are for containers of compression.
         This method should be override in child class.
         """
         raise NotImplementedError("packed_extensions() method must be overwritten on child class.")
 
-    def get_extensions(self, mimetype: str) -> list[str]:
+    def get_extensions(self, mimetype: str) -> frozenset[str]:
         """
         Method to get all registered extensions for given mimetype.
         This method should be override in child class.
@@ -93,6 +97,15 @@ class BaseMimeTyper:
         """
         raise NotImplementedError("get_mimetype() method must be overwritten on child class.")
 
+    def get_mimetype_and_type(self, extension: str) -> tuple[str | None, str | None]:
+        """
+        Method to get registered mimetype and its associated type for given extension at once.
+        This method can be override in child class to avoid looking up the mimetype twice.
+        """
+        mimetype: str | None = self.get_mimetype(extension)
+
+        return mimetype, self.get_type(mimetype, extension)
+
     def get_type(self, mimetype: str | None = None, extension: str | None = None) -> None | str:
         """
         Method to get the associated type for the given mimetype or extension.
@@ -153,6 +166,17 @@ class BaseMimeTyper:
         """
         return mimetype in self.compressed_mimetypes
 
+    def classify_extension(self, extension: str) -> tuple[bool, bool, bool]:
+        """
+        Method to check at once if an extension is related to a file that is compressed, lossless and packed,
+        in this order, to be used when setting up all those metadata of a file.
+        """
+        return (
+            extension in self.compressed_extensions,
+            extension in self.lossless_extensions,
+            extension in self.packed_extensions
+        )
+
 
 class LibraryMimeTyper(BaseMimeTyper):
     """
@@ -164,199 +188,321 @@ class LibraryMimeTyper(BaseMimeTyper):
     """
     Path of file `mime.types` to be loaded of known mimetypes.
     """
+    _initialized: bool = False
+    """
+    Variable that define whether the mimetypes library was already loaded with the file of known mimetypes, so
+    that instances created afterward don`t read the file again.
+    """
+    _types_map: dict[str, str] = mimetypes.types_map
+    """
+    Extension to mimetype map of `mimetypes` that the cached lookups were made against. `mimetypes.init` replaces
+    the map instead of updating it, so the cached lookups are cleared when the map is no longer this one.
+    """
+    lossless_mimetypes: frozenset[str] = frozenset({
+        'audio/mp4',
+        'audio/x-caf',
+        'audio/x-flac',
+        'audio/x-ms-wma',
+        'audio/x-oma',
+        'audio/x-pn-realaudio',
+        'audio/x-wav',
+        'image/raw',
+        'video/raw',
+    })
+    """
+    Set of mimetypes that are for lossless encoding.
+    """
+    lossless_extensions: frozenset[str] = frozenset({
+        '3fr',
+        'aa3',
+        'ari',
+        'arw',
+        'at3',
+        'at9',
+        'avif',
+        'bay',
+        'braw',
+        'bz2',
+        'caf',
+        'cap',
+        'cr2',
+        'cr3',
+        'crw',
+        'data',
+        'dcr',
+        'dcs',
+        'dng',
+        'drf',
+        'eip',
+        'erf',
+        'fff',
+        'flac',
+        'flif',
+        'gpr',
+        'iiq',
+        'k25',
+        'kdc',
+        'm4a',
+        'mdc',
+        'mef',
+        'mlp',
+        'mos',
+        'mp4a',
+        'mrw',
+        'nef',
+        'nrw',
+        'obm',
+        'oma',
+        'orf',
+        'osq',
+        'pef',
+        'ptx',
+        'pxn',
+        'r3d',
+        'raf',
+        'raw',
+        'rw2',
+        'rwl',
+        'rwz',
+        'sr2',
+        'srf',
+        'srw',
+        'tif',
+        'wav',
+        'x3f',
+    })
+    """
+    Set of extensions that are for lossless encoding.
+    """
+    compressed_mimetypes: frozenset[str] = frozenset({
+        'application/cz',
+        'application/epub+zip',
+        'application/gzip',
+        'application/java-archive',
+        'application/rar',
+        'application/vnd.apple.installer+xm',
+        'application/vnd.ezpix-album',
+        'application/vnd.ezpix-package',
+        'application/x-7z-compressed',
+        'application/x-cbr',
+        'application/x-debian-package',
+        'application/x-dgc-compressed',
+        'application/x-gtar',
+        'application/x-gzip',
+        'application/x-rar',
+        'application/x-rar-compressed',
+        'application/x-tar',
+        'application/zip',
+        'application/zlib',
+    })
+    """
+    Set of mimetypes that are for containers of compression.
+    """
+    compressed_extensions: frozenset[str] = frozenset({
+        '7z',
+        'abr',
+        'cb7',
+        'cba',
+        'cbr',
+        'cbt',
+        'cbz',
+        'cz',
+        'deb',
+        'dgc',
+        'ez2',
+        'ez3',
+        'gtar',
+        'gz',
+        'jar',
+        'mpkg',
+        'msi',
+        'rar',
+        'tar',
+        'zip',
+    })
+    """
+    Set of extensions that are for containers of compression.
+    """
+    packed_extensions: frozenset[str] = compressed_extensions | {
+        'psd',
+        'epub',
+        'mkv',
+        'mka',
+    }
+    """
+    Set of extensions that are for extractable containers of some sort.
+    """
+    preferred_extensions: ClassVar[Mapping[str, str]] = MappingProxyType({
+        'image/jpeg': 'jpg',
+        'video/mp4': 'mp4',
+    })
+    """
+    Map of mimetype to the extension that should be preferred when more than one extension is registered for it.
+    """
+    _known_types: frozenset[str] = frozenset({
+        'application',
+        'audio',
+        'binary',
+        'chemical',
+        'image',
+        'interface',
+        'message',
+        'model',
+        'multipart',
+        'text',
+        'video',
+        'x-conference',
+    })
+    """
+    Set of types available from file `mime.types`.
+    """
 
     def __init__(self) -> None:
         """
         Method that instantiate the mimetype library and load to it the file of known mimetypes.
         It will output a IOError, that must be caught in stack above, if file don't exists.
         """
+        # Loading the mimetypes read the system files and the file of known mimetypes, so it is done only once.
+        # A map replaced by a call to `mimetypes.init` outside this class is loaded again with the known mimetypes.
+        if (
+            LibraryMimeTyper._initialized
+            and mimetypes.inited
+            and LibraryMimeTyper._types_map is mimetypes.types_map
+        ):
+            return
+
         mimetypes.init(files=[self._known_mimetypes_file])
+        LibraryMimeTyper._types_map = mimetypes.types_map
+        LibraryMimeTyper._initialized = True
 
-    @property
-    def lossless_mimetypes(self) -> list[str]:
+        # Clear cached lookups as the known mimetypes were reloaded.
+        self.clear_cache()
+
+    @classmethod
+    def clear_cache(cls) -> None:
         """
-        Method to return as attribute the mimetypes that are for lossless encoding.
+        Method to clear the cached lookups of mimetypes and extensions, that must be called whenever the registered
+        mimetypes change.
         """
-        return [
-            'audio/mp4',
-            'audio/x-caf',
-            'audio/x-flac',
-            'audio/x-ms-wma',
-            'audio/x-oma',
-            'audio/x-pn-realaudio',
-            'audio/x-wav',
-            'image/raw',
-            'video/raw',
-        ]
+        cls._get_extensions.cache_clear()
+        cls._guess_extension_from_mimetype.cache_clear()
+        cls._get_mimetype_and_type.cache_clear()
 
-    @property
-    def lossless_extensions(self) -> list[str]:
+    @classmethod
+    def refresh_cache(cls) -> None:
         """
-        Method to return as attribute the extensions that are for lossless encoding.
+        Method to clear the cached lookups when the map of `mimetypes` was replaced by a call to `mimetypes.init`
+        outside this class.
         """
-        return [
-            '3fr',
-            'aa3',
-            'ari',
-            'arw',
-            'at3',
-            'at9',
-            'avif',
-            'bay',
-            'braw',
-            'bz2',
-            'caf',
-            'cap',
-            'cr2',
-            'cr3',
-            'crw',
-            'data',
-            'dcr',
-            'dcs',
-            'dng',
-            'drf',
-            'eip',
-            'erf',
-            'fff',
-            'flac',
-            'flif',
-            'gpr',
-            'iiq',
-            'k25',
-            'kdc',
-            'm4a',
-            'mdc',
-            'mef',
-            'mlp',
-            'mos',
-            'mp4a',
-            'mrw',
-            'nef',
-            'nrw',
-            'obm',
-            'oma',
-            'orf',
-            'osq',
-            'pef',
-            'ptx',
-            'pxn',
-            'r3d',
-            'raf',
-            'raw',
-            'rw2',
-            'rwl',
-            'rwz',
-            'sr2',
-            'srf',
-            'srw',
-            'tif',
-            'wav',
-            'x3f',
-        ]
+        if LibraryMimeTyper._types_map is not mimetypes.types_map:
+            LibraryMimeTyper._types_map = mimetypes.types_map
+            cls.clear_cache()
 
-    @property
-    def compressed_mimetypes(self) -> list[str]:
+    def register_mimetype(self, mimetype: str, extension: str) -> None:
         """
-        Method to return as attribute the mimetypes that are for containers of compression.
+        Method to register a new extension for mimetype in the mimetypes library.
+        The cached lookups are cleared, so that the new registration is used afterward. Registrations made calling
+        `mimetypes.add_type` directly require calling `clear_cache` afterward.
         """
-        return [
-            'application/cz',
-            'application/epub+zip',
-            'application/gzip',
-            'application/java-archive',
-            'application/rar',
-            'application/vnd.apple.installer+xm',
-            'application/vnd.ezpix-album',
-            'application/vnd.ezpix-package',
-            'application/x-7z-compressed',
-            'application/x-cbr',
-            'application/x-debian-package',
-            'application/x-dgc-compressed',
-            'application/x-gtar',
-            'application/x-gzip',
-            'application/x-rar',
-            'application/x-rar-compressed',
-            'application/x-tar',
-            'application/zip',
-            'application/zlib',
-        ]
+        mimetypes.add_type(mimetype, '.' + extension)
 
-    @property
-    def compressed_extensions(self) -> list[str]:
+        self.clear_cache()
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _get_extensions(mimetype: str) -> frozenset[str]:
         """
-        Method to return as attribute the extensions that are for containers of compression.
+        Method to get all registered extensions for given mimetype caching the result.
+        Because mimetypes.guess_all_extensions return extensions with dot in the begin we should remove it from
+        extensions. The result is a frozenset, as callers only check membership and the cached value cannot be
+        changed by them. Extensions are interned, so that membership checks against extensions obtained from
+        `guess_extension_from_filename` can be resolved by identity.
         """
-        return [
-            '7z',
-            'abr',
-            'cb7',
-            'cba',
-            'cbr',
-            'cbt',
-            'cbz'
-            'cz',
-            'deb',
-            'dgc',
-            'ez2',
-            'ez3',
-            'gtar',
-            'gz',
-            'jar',
-            'mpkg',
-            'msi',
-            'rar',
-            'tar',
-            'zip',
-        ]
+        return frozenset(intern(extension[1:]) for extension in mimetypes.guess_all_extensions(mimetype, False))
 
-    @property
-    def packed_extensions(self) -> list[str]:
+    @staticmethod
+    def _get_mimetype(extension: str) -> str | None:
+        """
+        Method to get registered mimetype for given extension directly from the map of `mimetypes`.
+        It is not cached, as a cached lookup would cost as much as the lookup in the map. The map is read from
+        `mimetypes` at each call, as `mimetypes.init` replaces it.
+        """
+        return mimetypes.types_map.get('.' + extension)
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _get_mimetype_and_type(extension: str) -> tuple[str | None, str | None]:
+        """
+        Method to get registered mimetype and its associated type for given extension caching the result, as both
+        are required together when extracting data from filename.
+        """
+        mimetype: str | None = LibraryMimeTyper._get_mimetype(extension)
+
+        if not mimetype:
+            return None, None
+
+        possible_type: str = mimetype.partition('/')[0]
+
+        return mimetype, possible_type if possible_type in LibraryMimeTyper._known_types else None
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _guess_extension_from_mimetype(mimetype: str) -> str | None:
         """
-        Method to return as attribute the extensions that are for extractable containers of some sort.
+        Method to get the best extension for given mimetype caching the result.
         """
-        return self.compressed_extensions + [
-            'psd',
-            'epub',
-            'mkv',
-            'mka',
-        ]
+        # The order of registration is kept here, as the first extension registered is the default one.
+        extensions: list[str] = mimetypes.guess_all_extensions(mimetype, False)
 
-    def get_extensions(self, mimetype: str) -> list[str]:
+        if not extensions:
+            return None
+
+        # Fix for jpe being returned instead of jpg, the preferred extension is only used when registered.
+        preferred: str | None = LibraryMimeTyper.preferred_extensions.get(mimetype)
+        if preferred and '.' + preferred in extensions:
+            return preferred
+
+        return extensions[0][1:]
+
+    def get_extensions(self, mimetype: str) -> frozenset[str]:
         """
         Method to get all registered extensions for given mimetype.
-        Because mimetypes.guess_all_extensions return extensions with dot in the begin we should remove it from
-        extensions.
         """
-        return [extension[1:] for extension in mimetypes.guess_all_extensions(mimetype, False)]
+        self.refresh_cache()
+
+        return self._get_extensions(mimetype)
 
     def get_mimetype(self, extension: str) -> str | None:
         """
         Method to get registered mimetype for given extension.
         """
-        return mimetypes.types_map.get('.' + extension, None)
+        return self._get_mimetype(extension)
+
+    def get_mimetype_and_type(self, extension: str) -> tuple[str | None, str | None]:
+        """
+        Method to get registered mimetype and its associated type for given extension at once.
+        """
+        self.refresh_cache()
+
+        return self._get_mimetype_and_type(extension)
 
     def get_type(self, mimetype: str | None = None, extension: str | None = None) -> None | str:
         """
         Method to get the associated type for the given mimetype or extension.
         """
-        if not (mimetype and extension):
+        if not mimetype and not extension:
             raise ValueError("mimetype or extension must be informed at LibraryMimeTyper.get_type.")
 
-        # Set-up list of types available from file `mime.types` as a set.
-        known_types: set[str] = {'application', 'audio', 'binary', 'chemical', 'image', 'interface', 'message', 'model',
-                       'multipart', 'text', 'video', 'x-conference'}
-
         if extension and not mimetype:
             mimetype = self.get_mimetype(extension)
 
         if not mimetype:
             return None
 
-        # Get set from mimetype using a list of first element before `/` in mimetype.
-        possible_type: list[str] = mimetype.split('/', 1)[:1]
-        possible_type_set = set(possible_type)
+        # Get type from mimetype as the first element before `/` in mimetype.
+        possible_type: str = mimetype.partition('/')[0]
 
-        return possible_type[0] if possible_type_set.intersection(known_types) else None
+        return possible_type if possible_type in self._known_types else None
 
     def guess_extension_from_mimetype(self, mimetype: str) -> str | None:
         """
@@ -366,29 +512,21 @@ class LibraryMimeTyper(BaseMimeTyper):
         which one if better suited for the mimetype, so we return the first one. Except for jpg, we return it instead
         of jpe and alternatives.
         """
-        extensions: list = self.get_extensions(mimetype)
-
-        if not extensions:
-            return None
-
-        # Fix for jpe being returned instead of jpg.
-        if 'jpg' in extensions:
-            return 'jpg'
-        if 'mp4' in extensions:
-            return 'mp4'
+        self.refresh_cache()
 
-        return extensions[0]
+        return self._guess_extension_from_mimetype(mimetype)
 
     def guess_extension_from_filename(self, filename: str) -> str | None:
         """
         Method to get the best extension for given filename in case there are more than one extension
         available using as base the filename that can or not have a registered extension in it.
         """
-        splitted: list[str] = filename.rsplit('.', 1)
-        maybe_extension: str = splitted[int(len(splitted) == 2)]
+        # The last element is the text after the last dot or the whole filename when there is no dot in it.
+        maybe_extension: str = filename.rpartition('.')[2]
 
         if maybe_extension and self.is_extension_registered(maybe_extension):
-            return maybe_extension
+            # Only registered extensions are interned, as those are a bounded set shared by many files.
+            return intern(maybe_extension)
 
         return None
 
@@ -22,8 +22,10 @@ Should there be a need for contact the electronic mail
 """
 from __future__ import annotations
 
+from functools import lru_cache, partial
 from importlib import import_module
 from inspect import isclass
+from operator import contains, eq
 from typing import Any, TYPE_CHECKING, Iterator
 
 from ..exception import ValidationError
@@ -44,21 +46,40 @@ class Processor:
     and the class with the methods to be run on pipelines.
     """
 
+    __slots__ = ("classname", "parameters", "process", "stop_check", "stop_value", "stopper")
+
     classname: Any
-    classname = None
     """
     The class for the processor, this is the class that actually run the processor`s method for pipeline.
     """
     parameters: dict
-    parameters = None
     """
     The parameters informed when instantiating Processor to be passed for the processor`s method.
     """
+    process: Any
+    """
+    The `process` method of classname bound when instantiating the Processor, to avoid forwarding it on every run.
+    """
+    stopper: bool
+    """
+    Copy of the `stopper` attribute of classname, or False when not defined, set when instantiating the Processor.
+    """
+    stop_value: Any
+    """
+    Copy of the `stop_value` attribute of classname, or True when not defined, set when instantiating the Processor.
+    """
+    stop_check: Any
+    """
+    Callable that receives the result of the processor and return whether it matches `stop_value`.
+    It is chosen when instantiating the Processor, so the type of `stop_value` is not checked on every run.
+    """
 
-    def __init__(self, source: Any, **kwargs: Any) -> None:
+    def __init__(self, source: Any, parameters: dict | None = None) -> None:
         """
         Method to instantiate the Processor object.
         """
+        self.parameters = {} if parameters is None else parameters
+
         # Validate processor reference being inputted.
         if isinstance(source, str):
             self.classname = self.get_classname(source)
@@ -73,24 +94,42 @@ class Processor:
             raise ValidationError(f"Class {self.classname.__name__} should implement the method `process` to be a "
                                   f"valid processor class.")
 
-        # Set-up attributes from kwargs like `classname` or `parameters`
-        for key, value in kwargs.items():
-            if hasattr(self, key):
-                setattr(self, key, value)
+        self.process = self.classname.process
+
+        # Bind the stop configuration once, so `Pipeline.run` don`t need to look it up at classname on every run.
+        self.stopper = getattr(self.classname, 'stopper', False)
+        self.stop_value = getattr(self.classname, 'stop_value', True)
+
+        if isinstance(self.stop_value, (list, tuple, set, frozenset)):
+            # Stop values are checked against the result of every run, so we freeze them for hashed membership.
+            # Values that cannot be hashed are kept as informed.
+            stop_values: list | tuple | set | frozenset
+            try:
+                stop_values = frozenset(self.stop_value)
+            except TypeError:
+                stop_values = self.stop_value
+
+            self.stop_check = partial(contains, stop_values)
+        else:
+            self.stop_check = partial(eq, self.stop_value)
 
     def __getattr__(self, item: str) -> Any:
         """
         Method to return classname.<item> if no attribute is found in current object.
+        This method is only called when the normal lookup fails, so slots already set are never forwarded.
         """
-        if item in self.__dict__:
-            return self.__dict__[item]
+        if item in Processor.__slots__:
+            # Slot not set yet, like when unpickling, should not be forwarded to avoid recursion at classname.
+            raise AttributeError(item)
 
         return getattr(self.classname, item)
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def get_classname(dotted_path: str) -> Any:
         """
         Method to obtain and import the processor`s class from the path informed at `dotted_path`.
+        The class is cached by its path, as pipelines are usually built many times from the same paths.
         """
         try:
             module_path, class_name = dotted_path.rsplit('.', 1)
@@ -106,6 +145,8 @@ class Pipeline:
     Class to initiate a pipelines with given processors to be run.
     """
 
+    __slots__ = ("errors", "last_result", "pipeline_processors", "processors_candidate", "processors_ran")
+
     def __init__(self, *processors_candidate: Any, **kwargs: Any) -> None:
         """
         This method can receive multiples
@@ -127,9 +168,10 @@ class Pipeline:
         """
         Variable to register the last result obtained from pipeline.
         """
-        self.pipeline_processors: list[Processor] = []
+        self.pipeline_processors: tuple[Processor, ...] = ()
         """
         Variable to register the available processors for the current pipeline object.
+        It is a tuple as processors are not changed while running the pipeline.
         """
         self.errors: list = []
         """
@@ -140,7 +182,14 @@ class Pipeline:
         Variable to register the original input that instantiate the Pipeline`s object.
         """
 
+        processors: list[Processor] = []
+
         for candidate in self.processors_candidate:
+            # Processor already instantiated can be added directly.
+            if isinstance(candidate, Processor):
+                processors.append(candidate)
+                continue
+
             try:
                 # Get parameters if there is any besides processor in list or tuple.
                 if isinstance(candidate, (tuple, list)):
@@ -148,10 +197,12 @@ class Pipeline:
                 else:
                     parameters, processor_candidate = {}, candidate
 
-                self.add_processor(Processor(source=processor_candidate, parameters=parameters))
+                processors.append(Processor(source=processor_candidate, parameters=parameters))
             except ValidationError:
                 continue
 
+        self.pipeline_processors = tuple(processors)
+
     def __getitem__(self, item: int) -> Processor:
         """
         Method to allow extraction of processor class from pipeline_processors directly from Pipeline object.
@@ -180,7 +231,7 @@ class Pipeline:
         """
         Method adds a processor object to list of processors.
         """
-        self.pipeline_processors.append(processor)
+        self.pipeline_processors += (processor,)
 
     def run(self, object_to_process: BaseFile, **parameters: Any) -> None:
         """
@@ -194,33 +245,27 @@ class Pipeline:
         ran: int = 0
         result: bool | None = None
         errors_found: list = []
+        extend_errors = errors_found.extend
 
         for processor in self.pipeline_processors:
-            result = processor.process(object_to_process=object_to_process, **processor.parameters, **parameters)
+            # Avoid merging the parameters of the processor with empty ones from run, that is the most common case.
+            if parameters:
+                result = processor.process(object_to_process=object_to_process, **processor.parameters, **parameters)
+            else:
+                result = processor.process(object_to_process=object_to_process, **processor.parameters)
             ran += 1
 
-            if hasattr(processor, 'errors') and processor.errors:
-                errors_found += processor.errors
-
-            if hasattr(processor, 'stopper') and processor.stopper:
-                # If processor is a step that should stop the whole pipeline
-                # we verify if we reach the condition to it stop. By default, that
-                # condition is True, but can be any value set-up in stop_value and
-                # returned by processor.
-                try:
-                    stop_value: bool | list | tuple | set = processor.stop_value
-                except AttributeError:
-                    # Don`t have stop value, so we consider the default `True`.
-                    stop_value = True
-
-                should_stop: bool = (
-                    result in stop_value
-                    if isinstance(stop_value, (list, tuple, set))
-                    else result == stop_value
-                )
-
-                if should_stop:
-                    break
+            # Errors are registered at the processor`s class, so we look it up there directly.
+            processor_errors: list | None = getattr(processor.classname, 'errors', None)
+            if processor_errors:
+                extend_errors(processor_errors)
+
+            # If processor is a step that should stop the whole pipeline
+            # we verify if we reach the condition to it stop. By default, that
+            # condition is True, but can be any value set-up in stop_value and
+            # returned by processor.
+            if processor.stopper and processor.stop_check(result):
+                break
 
         # register statical data about pipelines.
         self.processors_ran = ran
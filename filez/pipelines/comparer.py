@@ -22,8 +22,13 @@ Should there be a need for contact the electronic mail
 """
 from __future__ import annotations
 
+import mmap
+from functools import partial
+from io import BytesIO, StringIO
 from typing import Any, TYPE_CHECKING
 
+from . import Processor
+
 if TYPE_CHECKING:
     from ..file import BaseFile
 
@@ -50,6 +55,35 @@ class Comparer:
     """
     Variable that define if this class used as processor should stop the pipeline.
     """
+    cost: int = 1000
+    """
+    Relative cost of running this comparer, used by `order_by_cost` to run the cheaper ones first, so that those can
+    stop the pipeline before the expensive ones are run.
+    """
+
+    @classmethod
+    def get_cost(cls, candidate: Any) -> int:
+        """
+        Method to get the cost of the comparer class of a processor candidate informed in any of the formats accepted
+        by Pipeline: dotted path, class, Processor or tuple and list with parameters.
+        """
+        if isinstance(candidate, Processor):
+            candidate = candidate.classname
+        elif isinstance(candidate, (tuple, list)):
+            candidate = candidate[0]
+
+        if isinstance(candidate, str):
+            candidate = Processor.get_classname(candidate)
+
+        return getattr(candidate, 'cost', cls.cost)
+
+    @classmethod
+    def order_by_cost(cls, *processors_candidate: Any) -> tuple[Any, ...]:
+        """
+        Method to order the processor candidates of a compare Pipeline from cheaper to expensive by their `cost`,
+        to be used when declaring the pipeline. The informed order is kept for candidates with the same cost.
+        """
+        return tuple(sorted(processors_candidate, key=cls.get_cost))
 
     @classmethod
     def is_the_same(cls, file_1: BaseFile, file_2: BaseFile) -> None | bool:
@@ -60,7 +94,12 @@ class Comparer:
         raise NotImplementedError("The method is_the_same needs to be overwrite on child class.")
 
     @classmethod
-    def process(cls, **kwargs: Any) -> None | bool:
+    def process(
+        cls,
+        object_to_process: BaseFile,
+        objects_to_compare: list[BaseFile] | tuple[BaseFile, ...] | None = None,
+        **kwargs: Any
+    ) -> None | bool:
         """
         Method used to run this class on Processor`s Pipeline for Files.
         This method and to_processor() is not need to compare files outside a pipeline.
@@ -72,20 +111,19 @@ class Comparer:
         This processor return boolean whether files are the same, different of others processors that return boolean
         to indicate that process was ran successfully.
         """
-        object_to_process = kwargs.pop('object_to_process')
-        objects_to_compare = kwargs.pop('objects_to_compare')
-
         if not objects_to_compare or not isinstance(objects_to_compare, (list, tuple)):
             raise ValueError("There must be at least one object to compare at `objects_to_compare`s kwargs for "
                              "`Comparer.process`.")
 
-        for element in objects_to_compare:
-            is_the_same = cls.is_the_same(object_to_process, element)
-            if not is_the_same:
-                # This can return None or False
-                return is_the_same
-
-        return True
+        # Return the first result that is not the same, this can be None or False, or True when all are the same.
+        return next(
+            (
+                is_the_same
+                for is_the_same in map(partial(cls.is_the_same, object_to_process), objects_to_compare)
+                if not is_the_same
+            ),
+            True
+        )
 
 
 class DataCompare(Comparer):
@@ -97,92 +135,157 @@ class DataCompare(Comparer):
     """
     Variable that define if this class used as processor should stop the pipeline when resulting in stop_value`s values.
     """
+    cost: int = 100
+    """
+    Relative cost of running this comparer.
+    """
+    block_size: int = 1 << 20
+    """
+    Size of the blocks of content read from each file to be compared.
+    """
+    trusted_hashers: frozenset[str] = frozenset({'sha256', 'sha512', 'blake2b'})
+    """
+    Name of hashers whose digests are considered collision resistant enough to tell that two files are the same
+    without comparing their content.
+    """
+
+    @classmethod
+    def compare_hashes(cls, file_1: BaseFile, file_2: BaseFile) -> bool | None:
+        """
+        Method used to compare the digests already generated for both files before scanning their content.
+        Any different digest means that files are different, while an equal digest only means that files are the same
+        when generated by a hasher in `trusted_hashers`.
+        This method returns None if the comparison by digests is not conclusive.
+        """
+        # Hashes pending to be generated may not correspond to the current content.
+        if file_1._actions.hash or file_2._actions.hash or not file_1.hashes or not file_2.hashes:
+            return None
+
+        hashes_1 = file_1.hashes
+        hashes_2 = file_2.hashes
+        common_hashers = hashes_1.keys() & hashes_2.keys()
+
+        for hasher_name in common_hashers:
+            if hashes_1[hasher_name][0] != hashes_2[hasher_name][0]:
+                return False
+
+        return True if common_hashers & cls.trusted_hashers else None
+
+    @staticmethod
+    def get_view(buffer: Any) -> memoryview | None:
+        """
+        Method used to obtain a view of the whole content of a binary buffer without copying it.
+        Streams in memory expose their own buffer, while streams of files in the file system are mapped to memory.
+        This method returns None if the buffer cannot be viewed, like empty files or streams without file descriptor.
+        """
+        if isinstance(buffer, BytesIO):
+            return buffer.getbuffer()
+
+        try:
+            return memoryview(mmap.mmap(buffer.fileno(), 0, access=mmap.ACCESS_READ))
+        except (AttributeError, OSError, ValueError):
+            # Buffer without file descriptor (UnsupportedOperation is a OSError) or empty file that cannot be mapped.
+            return None
+
+    @classmethod
+    def compare_views(cls, view_1: memoryview, view_2: memoryview) -> bool:
+        """
+        Method used to compare two views of binary content by blocks of memory.
+        Comparing memoryview with memoryview is made item by item, so each block of the first view is copied to a
+        reusable bytearray, that is compared with the second view by `memcmp`, being much faster than the copy itself.
+        """
+        size = len(view_1)
+        if size != len(view_2):
+            return False
+
+        block_size = cls.block_size
+        block = bytearray(min(block_size, size))
+
+        for offset in range(0, size, block_size):
+            end = offset + block_size
+
+            if end > size:
+                # Last block smaller than the reusable one.
+                block = bytearray(view_1[offset:size])
+            else:
+                block[:] = view_1[offset:end]
+
+            if block != view_2[offset:end]:
+                return False
+
+        return True
 
     @classmethod
     def is_the_same(cls, file_1: BaseFile, file_2: BaseFile) -> bool | None:
         """
         Method used to check if two files are the same.
-        This method check byte by byte.
+        This method check block by block.
         This method assumes that data has the same size and both has the same value
         to is_binary, thus use it after SizeCompare and BinaryCompare.
 
-        Because the content buffers can have difference in sizes, we should make use
-        of a additional buffer to save parts of content to compare. Using the lower size of buffer
-        between the two files.
+        Both buffers are read with the same block size, so blocks can be compared directly without an
+        additional buffer. Binary content in memory or in the file system is compared through views of it instead.
+        The content is not read at all when the digests already generated for both files are conclusive.
         """
-        def compare_buffer():
-            """
-            Internal function to compare two buffer's data.
-            This function will compare the buffer extracting from it the content of same size, usually
-            the lowest buffer size between those buffers.
-            """
-            # Compare same size buffer
-            if buffer_1[:buffer_size] != buffer_2[:buffer_size]:
-                raise StopIteration()
-
-            # Normalize buffer returning modified buffer (after comparing above)
-            return buffer_1[buffer_size:], buffer_2[buffer_size:]
+        result: bool | None = cls.compare_hashes(file_1, file_2)
+
+        if result is not None:
+            return result
 
         try:
             # Check if there is a content so we don't compare empty content. It is checked by property content of
-            # BaseFile when calling .content
-            content_1 = file_1.content_as_iterator
-            content_2 = file_2.content_as_iterator
+            # BaseFile when calling .content_as_buffer
+            buffer_1 = file_1.content_as_buffer
+            buffer_2 = file_2.content_as_buffer
 
-            # Comparing data between binary and string should return False, they are not the same anyway.
-            if file_1.is_binary != file_2.is_binary:
-                return False
+        except ValueError:
+            return None
+
+        if buffer_1 is None or buffer_2 is None:
+            return None
 
-            # Set-up initial data for additional buffer
-            value_1: str | bytes | None
-            value_2: str | bytes | None
-            buffer_1: str | bytes | None
-            buffer_2: str | bytes | None
+        # Comparing data between binary and string should return False, they are not the same anyway.
+        if file_1.is_binary != file_2.is_binary:
+            return False
+
+        try:
+            # Content fully in memory is compared as a whole, BytesIO.getvalue don`t copy the content while it is not
+            # being exported or changed, so the comparison is a single `memcmp`.
+            if isinstance(buffer_1, (BytesIO, StringIO)) and isinstance(buffer_2, (BytesIO, StringIO)):
+                return buffer_1.getvalue() == buffer_2.getvalue()
 
             if file_1.is_binary:
-                value_1 = buffer_1 = b''
-                value_2 = buffer_2 = b''
-            else:
-                value_1 = buffer_1 = ''
-                value_2 = buffer_2 = ''
+                view_1 = cls.get_view(buffer_1)
+                view_2 = cls.get_view(buffer_2) if view_1 is not None else None
 
-            # Normalize buffer size to be the minimum denominator between buffers
-            buffer_size = min(file_1._content._block_size, file_2._content._block_size)
+                try:
+                    if view_1 is not None and view_2 is not None:
+                        return cls.compare_views(view_1, view_2)
+                finally:
+                    # Views must be released before the buffer can be changed or the file mapped be closed.
+                    for view in (view_1, view_2):
+                        if view is not None:
+                            view.release()
 
-        except ValueError:
-            return None
+            read_1 = buffer_1.read
+            read_2 = buffer_2.read
+            block_size = cls.block_size
 
-        try:
-            # Loop through content adding to new buffer to allow comparison between normalized sizes.
-            while not (value_1 is None and value_2 is None):
-                # We should avoid raising StopIteration so we define a default value to return instead.
-                value_1 = next(content_1, None)
-                value_2 = next(content_2, None)
-
-                if value_1 is not None:
-                    # Add data to buffer
-                    buffer_1 += value_1
-
-                if value_2 is not None:
-                    # Add data to buffer
-                    buffer_2 += value_2
-
-                if len(buffer_1) >= buffer_size and len(buffer_2) >= buffer_size:
-                    # Normalize buffer (after comparing above)
-                    # compare_buffer will raise StopIterator case the comparison is False.
-                    buffer_1, buffer_2 = compare_buffer()
-
-            # If there is still buffer to verify, check buffer data
-            while max(len(buffer_1), len(buffer_2)) >= buffer_size:
-                # Normalize buffer (after comparing above)
-                # compare_buffer will raise StopIterator case the comparison is False.
-                buffer_1, buffer_2 = compare_buffer()
+            while True:
+                block_1 = read_1(block_size)
 
-            return True
+                if block_1 != read_2(block_size):
+                    return False
 
-        except StopIteration:
-            # Case StopIteration as raised the comparison is false.
-            return False
+                # Both blocks are empty only when both buffers were consumed.
+                if not block_1:
+                    return True
+
+        finally:
+            # Reset buffers to begin from first position, so content can be used after comparing.
+            for buffer in (buffer_1, buffer_2):
+                if buffer.seekable():
+                    buffer.seek(0)
 
 
 class SizeCompare(Comparer):
@@ -194,6 +297,10 @@ class SizeCompare(Comparer):
     """
     Variable that define if this class used as processor should stop the pipeline when resulting in stop_value`s values.
     """
+    cost: int = 1
+    """
+    Relative cost of running this comparer.
+    """
 
     @classmethod
     def is_the_same(cls, file_1: BaseFile, file_2: BaseFile) -> bool | None:
@@ -216,6 +323,10 @@ class HashCompare(Comparer):
     """
     Variable that define if this class used as processor should stop the pipeline when resulting in stop_value`s values.
     """
+    cost: int = 5
+    """
+    Relative cost of running this comparer.
+    """
 
     @classmethod
     def is_the_same(cls, file_1: BaseFile, file_2: BaseFile) -> bool | None:
@@ -223,14 +334,19 @@ class HashCompare(Comparer):
         Method used to check if two files are the same.
         This method check the if hashes are the same.
         """
-        if not file_1.hashes or not file_2.hashes:
+        hashes_1 = file_1.hashes
+        hashes_2 = file_2.hashes
+
+        if not hashes_1 or not hashes_2:
             return None
 
-        for hash_name in set(file_1.hashes.keys()).intersection(set(file_2.hashes.keys())):
-            if file_1.hashes[hash_name] != file_2.hashes[hash_name]:
-                return False
+        common_hashers = hashes_1.keys() & hashes_2.keys()
 
-        return True
+        if not common_hashers:
+            return None
+
+        # Only the hex value is compared, the cached tuple also has the hash file and processor.
+        return not any(hashes_1[hash_name][0] != hashes_2[hash_name][0] for hash_name in common_hashers)
 
 
 class LousyNameCompare(Comparer):
@@ -242,6 +358,10 @@ class LousyNameCompare(Comparer):
     """
     Variable that define if this class used as processor should stop the pipeline when resulting in stop_value`s values.
     """
+    cost: int = 4
+    """
+    Relative cost of running this comparer.
+    """
 
     @classmethod
     def is_the_same(cls, file_1: BaseFile, file_2: BaseFile) -> bool | None:
@@ -252,16 +372,23 @@ class LousyNameCompare(Comparer):
         if not file_1.filename or not file_2.filename:
             return None
 
-        # Compare filenames and extension, but we assume that being the same mime_type it can have different
-        # extension if those are valid and registered
-        # to mime type.
-        extension = True
-        if file_1.extension and file_2.extension:
-            extension = file_1.mime_type_handler.get_mimetype(
-                file_1.extension
-            ) == file_2.mime_type_handler.get_mimetype(file_2.extension)
+        # Compare filenames and extension before the mimetype, as it don`t require any lookup.
+        if file_1.complete_filename != file_2.complete_filename:
+            return False
+
+        extension_1 = file_1.extension
+        extension_2 = file_2.extension
+
+        # Compare extensions, but we assume that being the same mime_type it can have different
+        # extension if those are valid and registered to mime type. Equal or missing extensions are always of the
+        # same mime_type, so the lookup is skipped. Extensions are casefolded, so the lookup of mimetype is shared
+        # between cases.
+        if not extension_1 or not extension_2 or extension_1 == extension_2:
+            return True
 
-        return file_1.complete_filename == file_2.complete_filename and extension
+        return file_1.mime_type_handler.get_mimetype(
+            extension_1.casefold()
+        ) == file_2.mime_type_handler.get_mimetype(extension_2.casefold())
 
 
 class NameCompare(Comparer):
@@ -273,6 +400,10 @@ class NameCompare(Comparer):
     """
     Variable that define if this class used as processor should stop the pipeline when resulting in stop_value`s values.
     """
+    cost: int = 3
+    """
+    Relative cost of running this comparer.
+    """
 
     @classmethod
     def is_the_same(cls, file_1: BaseFile, file_2: BaseFile) -> bool | None:
@@ -295,6 +426,10 @@ class MimeTypeCompare(Comparer):
     """
     Variable that define if this class used as processor should stop the pipeline when resulting in stop_value`s values.
     """
+    cost: int = 2
+    """
+    Relative cost of running this comparer.
+    """
 
     @classmethod
     def is_the_same(cls, file_1: BaseFile, file_2: BaseFile) -> bool | None:
@@ -317,6 +452,10 @@ class BinaryCompare(Comparer):
     """
     Variable that define if this class used as processor should stop the pipeline when resulting in stop_value`s values.
     """
+    cost: int = 1
+    """
+    Relative cost of running this comparer.
+    """
 
     @classmethod
     def is_the_same(cls, file_1: BaseFile, file_2: BaseFile) -> bool | None:
@@ -342,6 +481,10 @@ class TypeCompare(Comparer):
     """
     Variable that define if this class used as processor should stop the pipeline when resulting in stop_value`s values.
     """
+    cost: int = 2
+    """
+    Relative cost of running this comparer.
+    """
 
     @classmethod
     def is_the_same(cls, file_1: BaseFile, file_2: BaseFile) -> bool | None:
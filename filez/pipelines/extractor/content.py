@@ -26,7 +26,7 @@ from io import StringIO
 from typing import TYPE_CHECKING, Any
 
 import fitz
-from tinytag import TinyTag
+from tinytag import Flac, ID3, Ogg, TinyTag
 
 from .extractor import Extractor
 from ...image import WandImage
@@ -168,53 +168,100 @@ class AudioMetadataFromContentExtractor(Extractor):
     be caught only in stack above.
     """
 
+    attributes_to_extract: frozenset[str] = frozenset({
+        'album',
+        'albumartist',
+        'artist',
+        'audio_offset',
+        'bitrate',
+        'channels',
+        'comment',
+        'composer',
+        'disc',
+        'disc_total',
+        'duration',
+        'extra',
+        'genre',
+        'samplerate',
+        'title',
+        'track',
+        'track_total',
+        'year'
+    })
+    """
+    Attributes of TinyTag to be saved in the file`s meta.
+    """
+    magic_bytes: tuple[tuple[bytes, type[TinyTag]], ...] = (
+        (b'ID3', ID3),
+        (b'\xff\xfb', ID3),
+        (b'fLaC', Flac),
+        (b'OggS', Ogg),
+    )
+    """
+    Magic bytes at the start of the content and the child class of TinyTag that parses it.
+    """
+
+    @classmethod
+    def get_parser_class(cls, buffer: Any) -> type[TinyTag]:
+        """
+        Method to get the child class of TinyTag that parses the content of the file, as TinyTag itself doesn`t parse
+        any format. The parser is chosen from the magic bytes at the start of the buffer, and the buffer is
+        returned to its position afterward.
+        """
+        position: int = buffer.tell()
+        header: bytes = buffer.read(4)
+        buffer.seek(position)
+
+        for magic, parser_class in cls.magic_bytes:
+            if header.startswith(magic):
+                return parser_class
+
+        raise ValueError(
+            "No parser of TinyTag supports the file for `AudioMetadataFromContentExtractor.extract`!"
+        )
+
     @classmethod
     def extract(cls, file_object: BaseFile, overrider: bool, **kwargs: Any) -> None:
         """
         Method to extract additional metadata information from content.
         """
         # Use tinytag to get additional metadata.
-        if not file_object.content:
+        # The buffer is used to check the content instead of `content` to avoid loading the whole content in memory.
+        buffer = file_object.content_as_buffer
+
+        if not buffer:
             raise ValueError(
                 "Attribute `content` or `content_as_buffer` must be settled before calling "
                 "`AudioMetadataFromContentExtractor.extract`!"
             )
-        if not len(file_object):
+
+        length: int = len(file_object)
+
+        if not length:
             raise ValueError(
                 "Length for file's object must set before calling `AudioMetadataFromContentExtractor.extract`!"
             )
 
+        parser_class: type[TinyTag] = cls.get_parser_class(buffer)
+
         # We don't need to reset the buffer before calling it, because it will be reset
         # if already cached. The next time property buffer is called it will reset again.
-        tinytag: TinyTag = TinyTag(file_object.content_as_buffer, len(file_object))
+        tinytag: TinyTag = parser_class(buffer, length)
         tinytag.load(tags=True, duration=True, image=False)
+
         # Same as code in tinytag, it turn default dict into dict so that it can throw KeyError
         tinytag.extra = dict(tinytag.extra)
 
-        attributes_to_extract: set[str] = {
-            'album',
-            'albumartist',
-            'artist',
-            'audio_offset',
-            'bitrate',
-            'channels',
-            'comment',
-            'composer',
-            'disc',
-            'disc_total',
-            'duration',
-            'extra',
-            'genre',
-            'samplerate',
-            'title',
-            'track',
-            'track_total',
-            'year'
-        }
-        for attribute in attributes_to_extract:
+        meta = file_object.meta
+
+        for attribute in cls.attributes_to_extract:
+            # Avoid obtaining the attribute from tinytag when it will not be used.
+            if not overrider and getattr(meta, attribute, None):
+                continue
+
             tinytag_attribute = getattr(tinytag, attribute, None)
-            if tinytag_attribute and (not getattr(file_object.meta, attribute, None) or overrider):
-                setattr(file_object.meta, attribute, tinytag_attribute)
+            if tinytag_attribute:
+                setattr(meta, attribute, tinytag_attribute)
 
 
 class MimeTypeFromContentExtractor(Extractor):
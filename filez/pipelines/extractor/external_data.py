@@ -22,9 +22,14 @@ Should there be a need for contact the electronic mail
 """
 from __future__ import annotations
 
+import re
 from datetime import datetime
-from time import strptime, mktime
-from typing import Any, TYPE_CHECKING, Type
+from os import stat_result
+from stat import S_ISDIR
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Any, Pattern, TYPE_CHECKING, Type
+from urllib.parse import unquote
 
 from .extractor import Extractor
 
@@ -32,8 +37,10 @@ if TYPE_CHECKING:
     from io import BytesIO, StringIO
 
     from ...file import BaseFile
+    from ...file.hash import FileHashes
     from ...storage import Storage
     from ...handler import URI
+    from ...mimetype import BaseMimeTyper
 
 __all__ = [
     'FileSystemDataExtractor',
@@ -71,7 +78,10 @@ class FilenameAndExtensionFromPathExtractor(Extractor):
         # As this extractor don`t guarantee that the file actually exists we don`t mark it
         as saved.
         """
-        if not file_object.path:
+        # Path is a property, so it is looked up only once.
+        path: str | None = file_object.path
+
+        if not path:
             raise ValueError(
                 "Attribute `path` must be settled before calling `FilenameAndExtensionFromPathExtractor.extract`."
             )
@@ -83,16 +93,16 @@ class FilenameAndExtensionFromPathExtractor(Extractor):
         file_system_handler: Type[Storage] = file_object.storage
 
         # Set-up save_to and relative_path
-        file_object.save_to = file_system_handler.get_directory_from_path(file_object.path)
+        file_object.save_to = file_system_handler.get_directory_from_path(path)
 
         # Relative path is empty, because save_to is the whole directory
         file_object.relative_path = ''
 
         # Get complete filename from path
-        complete_filename = file_system_handler.get_filename_from_path(file_object.path)
+        complete_filename = file_system_handler.get_filename_from_path(path)
 
-        # Check if there is any extension in complete_filename and if there is known extension
-        if '.' in complete_filename and file_object.add_valid_filename(complete_filename):
+        # Check if there is known extension in complete_filename
+        if file_object.add_valid_filename(complete_filename):
             return
 
         # No extension registered found, so we set extension as empty.
@@ -105,6 +115,31 @@ class FilenameFromMetadataExtractor(Extractor):
     Class that define the extraction of filename from metadata passed to extract.
     """
 
+    filename_pattern: Pattern = re.compile(r'(?:^|;)\s*filename(\*?)\s*=\s*(?:"([^"]*)"|([^;]*))', re.IGNORECASE)
+    """
+    Define the parameters `filename` and `filename*` of `Content-Disposition` with their quoted or bare value. The
+    parameter must start the header or follow a `;`, so that parameters like `myfilename` are not matched.
+    """
+
+    @staticmethod
+    def decode_extended_value(value: str) -> str:
+        """
+        Method to decode the value of `filename*` in the format `charset'language'encoded-value`.
+        https://www.rfc-editor.org/rfc/rfc5987
+        """
+        charset, separator, remaining = value.partition("'")
+
+        if not separator:
+            return value
+
+        encoded_value: str = remaining.partition("'")[2]
+
+        try:
+            return unquote(encoded_value, encoding=charset or 'utf-8')
+        except LookupError:
+            # Charset not known by Python.
+            return unquote(encoded_value)
+
     @classmethod
     def extract(cls, file_object: BaseFile, overrider: bool, **kwargs: Any) -> None:
         """
@@ -124,52 +159,53 @@ class FilenameFromMetadataExtractor(Extractor):
             return
 
         try:
-            content_disposition: list[str] = MetadataExtractor.get_content_disposition(kwargs['metadata'])
+            metadata: dict[str, str] = MetadataExtractor.normalize_metadata(kwargs['metadata'])
 
-            if not content_disposition:
-                return
+        except KeyError:
+            # kwargs has no parameter metadata
+            raise ValueError('Parameter `metadata` must be informed as key argument for '
+                             '`FilenameFromMetadataExtractor.extract`.')
 
-            # Save metadata disposition as historic
-            file_object.meta.disposition = content_disposition
+        content_disposition: str | None = metadata.get('content-disposition')
 
-            candidates = [
-                content.strip()
-                for content in content_disposition
-                if 'filename' in content
-            ]
+        if not content_disposition:
+            return
 
-            if not candidates:
-                return
+        # Save metadata disposition as historic
+        file_object.meta.disposition = MetadataExtractor.get_content_disposition(metadata)
 
-            # Make `filename*=` be priority
-            candidates.sort()
+        # Make `filename*=` be priority, its value is encoded and must be decoded. As it has priority, it is tested
+        # as soon as it is matched, so the remaining of the header is not parsed when it is valid.
+        extended_filenames: list[str] = []
+        filenames: list[str] = []
 
-            filenames: list[str] = []
+        for match in cls.filename_pattern.finditer(content_disposition):
+            is_extended, quoted_value, value = match.groups('')
+            complete_filename: str = quoted_value or value.strip()
 
-            for candidate in candidates:
-                # Get indexes of `"`.
-                begin: int = candidate.index('"') + 1
-                end: int = candidate[begin:].index('"')
+            if not complete_filename:
+                continue
 
-                # Get filename with help of those indexes.
-                complete_filename = candidate[begin:end]
+            if is_extended:
+                complete_filename = cls.decode_extended_value(complete_filename)
 
                 # Check if filename has a valid extension
-                if '.' in complete_filename and file_object.add_valid_filename(complete_filename):
+                if file_object.add_valid_filename(complete_filename):
                     return
 
-                if complete_filename:
-                    filenames.append(complete_filename)
+                extended_filenames.append(complete_filename)
+            else:
+                filenames.append(complete_filename)
 
-            file_object.complete_filename_as_tuple = (filenames[0], "")
+        for complete_filename in filenames:
+            # Check if filename has a valid extension
+            if file_object.add_valid_filename(complete_filename):
+                return
 
-        except KeyError:
-            # kwargs has no parameter metadata
-            raise ValueError('Parameter `metadata` must be informed as key argument for '
-                             '`FilenameFromMetadataExtractor.extract`.')
-        except IndexError:
-            # filenames has no index 0, so extension was not set-up either, we just need to return.
-            return
+        filenames = extended_filenames + filenames
+
+        if filenames:
+            file_object.complete_filename_as_tuple = (filenames[0], "")
 
 
 class FileSystemDataExtractor(Extractor):
@@ -190,8 +226,10 @@ class FileSystemDataExtractor(Extractor):
         - update_date
         - content
         """
+        # Path is a property, so it is looked up only once.
+        path: str | None = file_object.path
 
-        if not file_object.path:
+        if not path:
             raise ValueError("Attribute `path` must be settled before calling `FileSystemDataExtractor.extract`.")
 
         if not file_object.type:
@@ -199,28 +237,31 @@ class FileSystemDataExtractor(Extractor):
 
         file_system_handler: Type[Storage] = file_object.storage
 
-        # Check if path exists
-        if not file_system_handler.exists(file_object.path):
+        # Get all status of path at once, as probing the file system for each data is expensive.
+        try:
+            stats: stat_result = file_system_handler.get_stats(path)
+        except FileNotFoundError:
             raise FileNotFoundError("There is no file following attribute `path` in the file system.")
 
         # Check if path is directory, it should not be
-        if file_system_handler.is_dir(file_object.path):
+        if S_ISDIR(stats.st_mode):
             raise ValueError("Attribute `path` in `file_object` must be a file not directory.")
 
-        # Get path id
+        # Get path id. The id is obtained from the storage, because it identifies the path itself and not the
+        # file it may link to, like the status used below.
         if not file_object.id or overrider:
-            file_object.id = file_system_handler.get_path_id(file_object.path)
+            file_object.id = file_system_handler.get_path_id(path)
 
         # Get path size
-        file_object.length = file_system_handler.get_size(file_object.path)
+        file_object.length = stats.st_size
 
         # Get created date
         if not file_object.create_date or overrider:
-            file_object.create_date = file_system_handler.get_created_date(file_object.path)
+            file_object.create_date = file_system_handler.get_created_date_from_stats(stats)
 
         # Get last modified date
         if not file_object.update_date or overrider:
-            file_object.update_date = file_system_handler.get_modified_date(file_object.path)
+            file_object.update_date = file_system_handler.get_modified_date_from_stats(stats)
 
         # Define mode from file type
         mode: str = 'r'
@@ -229,7 +270,7 @@ class FileSystemDataExtractor(Extractor):
             mode += 'b'
 
         # Get buffer io
-        buffer: BytesIO | StringIO = file_object.storage.open_file(file_object.path, mode=mode)
+        buffer: BytesIO | StringIO = file_system_handler.open_file(path, mode=mode)
 
         # Set content with buffer, as content is a property it will validate the buffer and
         # add it as a generator allowing to just loop through chunks of content.
@@ -265,11 +306,12 @@ class HashFileExtractor(Extractor):
             raise ValueError("Attribute `path` must be settled before calling `HashFileExtractor.extract`.")
 
         full_check: bool = kwargs.pop('full_check', True)
+        hashes: FileHashes = file_object.hashes
 
         for processor in file_object.hasher_pipeline:
             hasher: Any = processor.classname
 
-            if hasher in file_object.hashes and file_object.hashes[hasher] and not overrider:
+            if not overrider and hashes.get(hasher.hasher_name):
                 continue
 
             # Extract from hash file and save to hasher if hash file content found.
@@ -299,34 +341,65 @@ class MimeTypeFromFilenameExtractor(Extractor):
         if file_object.mime_type and not overrider:
             return
 
+        extension: str | None = file_object.extension
+
         # Check if there is an extension for file else is not possible to extract metadata from it.
-        if not file_object.extension:
+        if not extension:
             raise ValueError(
                 "Attribute `extension` must be settled before calling `MimeTypeFromFilenameExtractor.extract`."
             )
 
+        mime_type_handler: BaseMimeTyper = file_object.mime_type_handler
+
         # Save in file_object mimetype and type obtained from mime_type_handler.
-        file_object.mime_type = file_object.mime_type_handler.get_mimetype(file_object.extension)
-        file_object.type = file_object.mime_type_handler.get_type(file_object.mime_type, file_object.extension)
+        file_object.mime_type, file_object.type = mime_type_handler.get_mimetype_and_type(extension)
 
         # Save additional metadata to file.
-        file_object.meta.compressed = file_object.mime_type_handler.is_extension_compressed(
-            file_object.extension
-        )
-        file_object.meta.lossless = file_object.mime_type_handler.is_extension_lossless(
-            file_object.extension
-        )
-        file_object.meta.packed = file_object.mime_type_handler.is_extension_packed(
-            file_object.extension
-        )
+        file_meta = file_object.meta
+        file_meta.compressed, file_meta.lossless, file_meta.packed = mime_type_handler.classify_extension(extension)
         file_object._actions.to_list()
 
 
 class MetadataExtractor(Extractor):
     """
     Class that define the extraction of multiple file's data from metadata passed to extract.
+    The `get_*` methods expect metadata with lowercase keys as returned by `normalize_metadata`.
     """
 
+    stream_mimetypes: frozenset[str] = frozenset({
+        'application/octet-stream',
+        'binary/octet-stream',
+        'application/x-download',
+        'application/force-download',
+        'application/x-empty',
+    })
+    """
+    Mimetypes of generic streams of data, that don't have an extension associated with it.
+    """
+
+    @staticmethod
+    def normalize_metadata(metadata: Any) -> dict[str, str]:
+        """
+        Static method to obtain the metadata with lowercase keys, as header names are case-insensitive and can be
+        informed in any case, like lowercase from HTTP/2 responses.
+        """
+        return {key.lower(): value for key, value in metadata.items()}
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def parse_date(value: str) -> datetime | None:
+        """
+        Static method to convert a HTTP date to a datetime in local time without time zone, as the dates obtained from
+        the file system. `parsedate_to_datetime` understand the `GMT` time zone used by HTTP dates and is much faster
+        than `strptime`.
+        The result is cached by header value, as the same dates are repeated across responses of the same server.
+        https://developer.mozilla.org/en-US/docs/Web/HTTP/Headers/Date
+        """
+        try:
+            return datetime.fromtimestamp(parsedate_to_datetime(value).timestamp())
+        except (TypeError, ValueError):
+            return None
+
     @staticmethod
     def get_etag(metadata: dict) -> str:
         """
@@ -334,15 +407,21 @@ class MetadataExtractor(Extractor):
         https://developer.mozilla.org/en-US/docs/Web/HTTP/Headers/Etag
         """
         try:
-            etag: str = metadata['ETag']
-
-            begin: int = etag.index('"') + 1
-            end: int = etag[begin:].index('"')
-
-            return etag[begin:end]
+            etag: str = metadata['etag']
         except KeyError:
             return ""
 
+        # Search the closing quote from the opening one, without slicing the value, to get the opaque tag even when
+        # prefixed by the weak validator `W/`.
+        begin: int = etag.find('"') + 1
+        end: int = etag.find('"', begin) if begin else -1
+
+        if end < 0:
+            # Value without quotes, that is not compliant, is used as is.
+            return etag.strip()
+
+        return etag[begin:end]
+
     @staticmethod
     def get_mime_type(metadata: dict[str, str]) -> str | None:
         """
@@ -350,7 +429,7 @@ class MetadataExtractor(Extractor):
         https://developer.mozilla.org/en-US/docs/Web/HTTP/Headers/Content-Type
         """
         try:
-            return metadata['Content-Type'].split(';')[0].strip()
+            return metadata['content-type'].split(';')[0].strip()
 
         except (KeyError, IndexError):
             return None
@@ -362,7 +441,7 @@ class MetadataExtractor(Extractor):
         https://developer.mozilla.org/en-US/docs/Web/HTTP/Headers/Content-Length
         """
         try:
-            return int(metadata['Content-Length'])
+            return int(metadata['content-length'])
         except KeyError:
             return 0
 
@@ -371,28 +450,28 @@ class MetadataExtractor(Extractor):
         """
         Static method to extract last modified date from metadata.
         https://developer.mozilla.org/en-US/docs/Web/HTTP/Headers/Last-Modified
-        This method is not making use of time zone `%z`.
         """
         try:
-            return datetime.fromtimestamp(mktime(strptime(metadata['Last-Modified'], "%a, %d %b %Y %H:%M:%S %z")))
+            return MetadataExtractor.parse_date(metadata['last-modified'])
         except KeyError:
             return None
 
     @staticmethod
-    def get_date(metadata: dict[str, str]) -> datetime | None:
+    def get_date(metadata: dict[str, str], last_modified: datetime | None = None) -> datetime | None:
         """
         Static method to extract creation date from metadata.
         https://developer.mozilla.org/en-US/docs/Web/HTTP/Headers/Date
-        This method is not making use of time zone `%z`.
-        This method return the last modified date if no creation date is provided.
+        This method return the last modified date if no creation date is provided. The last modified date can be
+        informed in `last_modified` when already extracted to avoid parsing it again.
         """
-        last_modified: datetime | None = MetadataExtractor.get_last_modified(metadata)
+        if last_modified is None:
+            last_modified = MetadataExtractor.get_last_modified(metadata)
 
         try:
-            date: datetime = datetime.fromtimestamp(mktime(strptime(metadata['Date'], "%a, %d %b %Y %H:%M:%S %z")))
+            date: datetime | None = MetadataExtractor.parse_date(metadata['date'])
 
             # If Last-Modified is lower than Date return Last-Modified
-            if last_modified and last_modified < date:
+            if last_modified and (date is None or last_modified < date):
                 return last_modified
 
             return date
@@ -408,7 +487,7 @@ class MetadataExtractor(Extractor):
         try:
             return [
                 content.strip()
-                for content in metadata['Content-Disposition'].split(';')
+                for content in metadata['content-disposition'].split(';')
             ]
         except KeyError:
             return []
@@ -420,7 +499,7 @@ class MetadataExtractor(Extractor):
         https://developer.mozilla.org/en-US/docs/Web/HTTP/Headers/Expires
         """
         try:
-            return datetime.fromtimestamp(mktime(strptime(metadata['Last-Modified'], "%a, %d %b %Y %H:%M:%S %z")))
+            return MetadataExtractor.parse_date(metadata['expires'])
         except KeyError:
             return None
 
@@ -433,7 +512,7 @@ class MetadataExtractor(Extractor):
         try:
             return [
                 content.strip()
-                for content in metadata['Content-Language'].split(',')
+                for content in metadata['content-language'].split(',')
             ]
         except KeyError:
             return []
@@ -467,72 +546,92 @@ class MetadataExtractor(Extractor):
                 raise ValueError('Parameter `metadata` must be have value to be extract at '
                                  '`MetadataExtractor.extract`.')
 
-            # Set-up id from Etag
-            etag: str = cls.get_etag(meta)
+            # Normalize the case of header names once for all lookups below.
+            meta = cls.normalize_metadata(meta)
 
-            if etag and (not file_object.id or overrider):
-                file_object.id = etag
+            mime_type_handler: BaseMimeTyper = file_object.mime_type_handler
+
+            # Each value is only parsed from metadata when it will be set-up in file_object.
+            # Set-up id from Etag
+            if not file_object.id or overrider:
+                etag: str = cls.get_etag(meta)
+                if etag:
+                    file_object.id = etag
 
             # Set-up mimetype from metadata
-            mimetype: str | None = cls.get_mime_type(meta)
-            if mimetype and (not file_object.mime_type or overrider):
-                # Get mimetype
-                file_object.mime_type = mimetype
-
-            # Set-up extension from mimetype
-            if mimetype and (not file_object.extension or overrider):
-                # Get extensions from mimetype, only if mimetype is not stream (because it doesn't have an extension
-                # associated with stream), and if there is no one valid don't register one.
-                # In order to avoid wrong extension being settled is recommended to use an Extractor of
-                # `FilenameFromURLExtractor` and `FilenameFromMetadataExtractor` before this processor.
-                if 'stream' not in mimetype:
-                    possible_extension: str | None = file_object.mime_type_handler.guess_extension_from_mimetype(mimetype)
-
-                    if possible_extension:
-                        file_object.extension = possible_extension
-
-                        # Save additional metadata to file.
-                        file_object.meta.compressed = file_object.mime_type_handler.is_extension_compressed(
-                            file_object.extension
-                        )
-
-                        file_object.meta.lossless = file_object.mime_type_handler.is_extension_lossless(
-                            file_object.extension
-                        )
-
-                        file_object.meta.packed = file_object.mime_type_handler.is_extension_packed(
-                            file_object.extension
-                        )
-                        file_object._actions.to_list()
+            need_mimetype: bool = not file_object.mime_type or overrider
+            need_extension: bool = not file_object.extension or overrider
+
+            if need_mimetype or need_extension:
+                mimetype: str | None = cls.get_mime_type(meta)
+
+                if mimetype and need_mimetype:
+                    # Get mimetype
+                    file_object.mime_type = mimetype
+
+                # Set-up extension from mimetype
+                if mimetype and need_extension:
+                    # Get extensions from mimetype, only if mimetype is not stream (because it doesn't have an
+                    # extension associated with stream), and if there is no one valid don't register one.
+                    # In order to avoid wrong extension being settled is recommended to use an Extractor of
+                    # `FilenameFromURLExtractor` and `FilenameFromMetadataExtractor` before this processor.
+                    # Mimetypes are case-insensitive, so we compare it in lowercase.
+                    if mimetype.lower() not in cls.stream_mimetypes:
+                        possible_extension: str | None = mime_type_handler.guess_extension_from_mimetype(mimetype)
+
+                        if possible_extension:
+                            file_object.extension = possible_extension
+
+                            # Save additional metadata to file.
+                            file_meta = file_object.meta
+                            file_meta.compressed, file_meta.lossless, file_meta.packed = (
+                                mime_type_handler.classify_extension(file_object.extension)
+                            )
+                            file_object._actions.to_list()
 
             # Set-up type from mimetype and extension
-            if file_object.mime_type and file_object.extension and (not file_object.type or overrider):
-                file_object.type = file_object.mime_type_handler.get_type(file_object.mime_type, file_object.extension)
+            if not file_object.type or overrider:
+                mime_type: str | None = file_object.mime_type
+                extension: str | None = file_object.extension
+
+                if mime_type and extension:
+                    file_object.type = mime_type_handler.get_type(mime_type, extension)
+
+            # Last modified date is used for both created and updated date, so it is parsed only once and only if
+            # one of them will be set-up.
+            need_create_date: bool = not file_object.create_date or overrider
+            need_update_date: bool = not file_object.update_date or overrider
 
-            # Set-up created date from metadata
-            create_date = cls.get_date(meta)
-            if create_date and (not file_object.create_date or overrider):
-                file_object.create_date = create_date
+            if need_create_date or need_update_date:
+                update_date = cls.get_last_modified(meta)
 
-            # Set-up updated date from metadata
-            update_date = cls.get_last_modified(meta)
-            if update_date and (not file_object.update_date or overrider):
-                file_object.update_date = update_date
+                # Set-up created date from metadata
+                if need_create_date:
+                    create_date = cls.get_date(meta, last_modified=update_date)
+                    if create_date:
+                        file_object.create_date = create_date
+
+                # Set-up updated date from metadata
+                if update_date and need_update_date:
+                    file_object.update_date = update_date
 
             # Set-up length from metadata
-            length = cls.get_length(meta)
-            if length and (not file_object.length or overrider):
-                file_object.length = length
+            if not file_object.length or overrider:
+                length = cls.get_length(meta)
+                if length:
+                    file_object.length = length
 
             # Set-up language metadata from metadata
-            language = cls.get_language(meta)
-            if language and (not hasattr(file_object, 'language') or overrider):
-                file_object.meta.language = language
+            if not hasattr(file_object, 'language') or overrider:
+                language = cls.get_language(meta)
+                if language:
+                    file_object.meta.language = language
 
             # Set-up expiration date
-            expire_date = cls.get_expire(meta)
-            if expire_date and (not hasattr(file_object, 'expire') or overrider):
-                file_object.meta.expire = expire_date
+            if not hasattr(file_object, 'expire') or overrider:
+                expire_date = cls.get_expire(meta)
+                if expire_date:
+                    file_object.meta.expire = expire_date
 
         except KeyError:
             raise ValueError('Parameter `metadata` must be informed as key argument for '
@@ -578,29 +677,24 @@ class FilenameFromURLExtractor(Extractor):
             if not filenames_from_url:
                 return
 
-            # Modify list to also include boolean value to enforce_mimetype or not.
-            results = [
-                (result, True)
-                for result in filenames_from_url
-            ] + [
-                (result, False)
-                for result in filenames_from_url
-            ]
-
             # Loop through paths to use only the one with valid extension
-            # The first part of the loop enforce mimetype, second not enforce mimetype.
-            for result, enforce_mimetype in results:
-                # Check and set-up filename
-                if (result.filename and file_object.add_valid_filename(result.filename,
-                                                                       enforce_mimetype=enforce_mimetype)):
-                    processed_uri = result.processed_uri
+            # The first pass enforce mimetype, second not enforce mimetype.
+            for enforce_mimetype in (True, False):
+                for result in filenames_from_url:
+                    # Check and set-up filename
+                    if (result.filename and file_object.add_valid_filename(result.filename,
+                                                                           enforce_mimetype=enforce_mimetype)):
+                        processed_uri = result.processed_uri
+                        break
+
+                if processed_uri:
                     break
 
             if not processed_uri:
                 # Filename without valid extension, so we
                 # set it as complete_filename the last one.
                 # There will be no additional metadata `compressed` and `lossless`.
-                file_object.complete_filename_as_tuple = filenames_from_url[-1].filename.rsplit('.', 1)
+                file_object.complete_filename_as_tuple = cls.split_complete_filename(filenames_from_url[-1].filename)
                 processed_uri = filenames_from_url[-1].processed_uri
 
             # Set-up relative path
@@ -655,7 +749,7 @@ class PathFromURLExtractor(Extractor):
                     file_object.relative_path = path.directory
 
                     if not file_object.filename:
-                        file_object.complete_filename_as_tuple = cache.filename.rsplit('.', 1)
+                        file_object.complete_filename_as_tuple = cls.split_complete_filename(cache.filename)
 
                     return
 
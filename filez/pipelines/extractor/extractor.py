@@ -45,6 +45,16 @@ class Extractor:
         """
         raise NotImplementedError("Method extract must be overwritten on child class.")
 
+    @staticmethod
+    def split_complete_filename(complete_filename: str) -> tuple[str, str]:
+        """
+        Method to split a complete filename in a tuple of <filename, extension> at its last dot, to be set at
+        `complete_filename_as_tuple`. A complete filename without dot, or with only a leading one, has no extension.
+        """
+        filename, _, extension = complete_filename.rpartition('.')
+
+        return (filename, extension) if filename else (complete_filename, '')
+
     @classmethod
     def process(cls, **kwargs: Any) -> bool:
         """
@@ -25,12 +25,14 @@ Should there be a need for contact the electronic mail
 from __future__ import annotations
 
 import hashlib
-from typing import Any, Type, TYPE_CHECKING, Iterator, Sequence
+import mmap
+from functools import partial
+from typing import Any, Type, TYPE_CHECKING, Iterable, Iterator, Sequence
 
 from zlib import crc32
 
 # core modules
-from ..pipelines import Pipeline
+from . import Pipeline
 # modules
 from ..storage import Storage
 
@@ -67,6 +69,10 @@ class Hasher:
     """
     Cache of digested hashes for given objects filename.
     """
+    block_size: int = 1 << 20
+    """
+    Size of the blocks read from content when generating many hashes in a single pass.
+    """
 
     @classmethod
     def check_hash(cls, **kwargs: Any) -> bool:
@@ -154,6 +160,70 @@ class Hasher:
         for block in content_iterator:
             cls.update_hash(hash_instance, block)
 
+    @staticmethod
+    def get_mapped_content(buffer: Any) -> mmap.mmap | None:
+        """
+        Method to map to memory the whole content of a binary buffer of a file in the file system.
+        This method returns None if the buffer cannot be mapped, like empty files or streams without file descriptor.
+        """
+        try:
+            return mmap.mmap(buffer.fileno(), 0, access=mmap.ACCESS_READ)
+        except (AttributeError, OSError, ValueError):
+            # Buffer without file descriptor (UnsupportedOperation is a OSError) or empty file that cannot be mapped.
+            return None
+
+    @classmethod
+    def generate_hashes(cls, object_to_process: BaseFile, hashers: Iterable[Type[Hasher]]) -> None:
+        """
+        Method to generate the hash of all `hashers` reading the content of object_to_process only once.
+        Each block read is used to update every hash instance, that are cached by file id in the same way as
+        `process` does, so that the processors of the hasher pipeline only need to digest them afterwards.
+        Hashers with hash already set in object_to_process or with hash instance already cached are skipped.
+
+        Binary content of files in the file system is mapped to memory and given whole to each hasher, so that the
+        hash is generated in a single call to the hasher without iterating through blocks in Python.
+        """
+        file_id: str = str(id(object_to_process))
+
+        hashers = [
+            hasher for hasher in hashers
+            if hasher.hasher_name not in object_to_process.hashes and file_id not in hasher.get_hash_objects()
+        ]
+
+        if not hashers:
+            return
+
+        buffer: Any = object_to_process.content_as_buffer
+        if buffer is None:
+            return
+
+        hash_instances: list[tuple[Type[Hasher], Any]] = [
+            (hasher, hasher.get_hash_instance(file_id)) for hasher in hashers
+        ]
+
+        # Empty value of the same type as the buffer content, either bytes or str.
+        empty: bytes | str = buffer.read(0)
+
+        if isinstance(empty, bytes):
+            mapped_content: mmap.mmap | None = cls.get_mapped_content(buffer)
+
+            if mapped_content is not None:
+                try:
+                    for hasher, hash_instance in hash_instances:
+                        hasher.update_hash(hash_instance, mapped_content)
+                finally:
+                    mapped_content.close()
+
+                return
+
+        for block in iter(partial(buffer.read, cls.block_size), empty):
+            # Convert the block only once instead of once per hasher.
+            if isinstance(block, str):
+                block = block.encode('utf8')
+
+            for hasher, hash_instance in hash_instances:
+                hasher.update_hash(hash_instance, block)
+
     @classmethod
     def create_hash_file(cls, object_to_process: BaseFile, digested_hex_value: str) -> BaseFile:
         """
@@ -394,8 +464,10 @@ class MD5Hasher(Hasher):
     def instantiate_hash(cls) -> hashlib.md5:
         """
         Method to instantiate the hash generator to be used digesting the hash.
+        The hash is used to identify content, not for security, so it is flagged as such to allow its use in FIPS
+        builds of OpenSSL.
         """
-        return hashlib.md5()
+        return hashlib.md5(usedforsecurity=False)
 
 
 class SHA256Hasher(Hasher):
@@ -412,8 +484,10 @@ class SHA256Hasher(Hasher):
     def instantiate_hash(cls) -> hashlib.sha256:
         """
         Method to instantiate the hash generator to be used digesting the hash.
+        The hash is used to identify content, not for security, so it is flagged as such to allow its use in FIPS
+        builds of OpenSSL.
         """
-        return hashlib.sha256()
+        return hashlib.sha256(usedforsecurity=False)
 
 
 class CRC32Hasher(Hasher):
@@ -230,8 +230,9 @@ class ImageRender(StaticRender):
         if not buffer:
             raise RenderError("There is no content in buffer format available to render.")
 
-        # Resize image using the image_engine and default values.
-        image: ImageEngine = image_engine(buffer=buffer)
+        # Resize image using the image_engine and default values. The size hint allows engines to decode the image
+        # already reduced.
+        image: ImageEngine = image_engine(buffer=buffer, size_hint=(defaults.width, defaults.height))
 
         image.resize(defaults.width, defaults.height, keep_ratio=defaults.keep_ratio)
 
@@ -28,6 +28,7 @@ import os
 import re
 from datetime import datetime
 from filecmp import cmp
+from functools import lru_cache
 from glob import iglob
 from io import open
 from os.path import (
@@ -35,8 +36,6 @@ from os.path import (
     basename,
     dirname,
     exists,
-    getctime,
-    getmtime,
     getsize,
     isdir,
     join,
@@ -361,9 +360,11 @@ class Storage:
             return iglob(f"{path}")
 
     @classmethod
+    @lru_cache(maxsize=4096)
     def get_filename_from_path(cls, path: str) -> str:
         """
         Method used to get the filename from a complete path.
+        The result only depends on the path string, so it is cached.
         """
         return basename(path)
 
@@ -425,23 +426,52 @@ class Storage:
         """
         Method to get the size of file at path in bytes.
         """
-        return getsize(path)
+        return cls.get_stats(path).st_size
 
     @classmethod
     def get_modified_date(cls, path: str) -> datetime:
         """
         Method to get the modified time as datetime converted from float.
         """
-        return datetime.fromtimestamp(getmtime(path))
+        return cls.get_modified_date_from_stats(cls.get_stats(path))
 
     @classmethod
     def get_created_date(cls, path: str) -> datetime:
         """
         Try to get the date that a file was created, falling back to when it was
         last modified if that isn't possible.
+        The date is interpreted by `get_created_date_from_stats` that should be overwritten in child specific for
+        Operational System.
+        """
+        return cls.get_created_date_from_stats(cls.get_stats(path))
+
+    @classmethod
+    def get_stats(cls, path: str) -> os.stat_result:
+        """
+        Method to get all status of path from the file system with a single call, so that
+        multiple data can be extracted without probing the path again.
+        The default implementation uses `os.stat` operation, that follows symbolic links as `get_size` and the dates
+        always did, and it will raise FileNotFoundError if path don`t exist.
+        This method is the source of the size and dates of a path, so overriding it is enough to change all of them.
+        Override this method if that’s not appropriate for your storage.
+        """
+        return os.stat(path)
+
+    @classmethod
+    def get_modified_date_from_stats(cls, stats: os.stat_result) -> datetime:
+        """
+        Method to get the modified time as datetime from the status obtained with `get_stats`.
+        """
+        return datetime.fromtimestamp(stats.st_mtime)
+
+    @classmethod
+    def get_created_date_from_stats(cls, stats: os.stat_result) -> datetime:
+        """
+        Method to get the created time as datetime from the status obtained with `get_stats`.
         This method should be overwritten in child specific for Operational System.
         """
-        raise NotImplementedError("Method get_created_date(path) should be accessed through inherent class.")
+        raise NotImplementedError("Method get_created_date_from_stats(stats) should be accessed through inherent "
+                                  "class.")
 
     @classmethod
     def get_renamed_path(cls, path: str, sequence: int = 1) -> str:
@@ -499,11 +529,14 @@ class Storage:
                 line = file.readline()
 
     @classmethod
+    @lru_cache(maxsize=4096)
     def sanitize_path(cls, path: str) -> str:
         """
         Method to normalize a path for use.
         This method collapse redundant separators and up-level references so that A//B, A/B/, A/./B and A/foo/../B
         all become A/B.
+        The result only depends on the path string, so it is cached, as the same paths are sanitized by many
+        processors.
         """
         return normpath(path.replace('/', cls.sep))
 
@@ -558,23 +591,21 @@ class WindowsFileSystem(Storage):
         return str(output)
 
     @classmethod
-    def get_created_date(cls, path: str) -> datetime:
+    def get_created_date_from_stats(cls, stats: os.stat_result) -> datetime:
         """
-        Try to get the date that a file was created, falling back to when it was
-        last modified if that isn't possible.
-        See https://stackoverflow.com/a/39501288/1709587 for explanation.
-        Source: https://stackoverflow.com/a/39501288
+        Method to get the created time as datetime from the status obtained with `get_stats`.
+        At Windows `st_ctime` is the creation time.
         """
-        time = getctime(path)
-
-        return datetime.fromtimestamp(time)
+        return datetime.fromtimestamp(stats.st_ctime)
 
     @classmethod
+    @lru_cache(maxsize=4096)
     def sanitize_path(cls, path: str) -> str:
         """
         Method to normalize a path for use.
         This method collapse redundant separators and up-level references so that A//B, A/B/, A/./B and A/foo/../B
         all become A/B. It will also convert uppercase character to lowercase and `/` to `\\`.
+        The result only depends on the path string, so it is cached.
         """
         return normpath(normcase(path))
 
@@ -631,14 +662,13 @@ class LinuxFileSystem(Storage):
         return str(os.stat(path, follow_symlinks=False).st_ino)
 
     @classmethod
-    def get_created_date(cls, path: str) -> datetime:
+    def get_created_date_from_stats(cls, stats: os.stat_result) -> datetime:
         """
-        Try to get the date that a file was created, falling back to when it was
-        last modified if that isn't possible.
+        Method to get the created time as datetime from the status obtained with `get_stats`, falling back to when it
+        was last modified if that isn't possible.
         See https://stackoverflow.com/a/39501288/1709587 for explanation.
         Source: https://stackoverflow.com/a/39501288
         """
-        stats = os.stat(path)
         try:
             time = stats.st_birthtime
         except AttributeError:
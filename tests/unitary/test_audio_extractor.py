@@ -0,0 +1,96 @@
+"""
+Handler is a package for creating files in an object-oriented way,
+allowing extendability to any file system.
+
+Copyright (C) 2021 Gabriel Fontenelle Senno Silva
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Should there be a need for contact the electronic mail
+`filez <at> gabrielfontenelle.com` can be used.
+"""
+import struct
+from types import SimpleNamespace
+
+import pytest
+
+from filez.pipelines.extractor.content import AudioMetadataFromContentExtractor
+
+
+def mp3_content():
+    """
+    Method to build a MP3 with a ID3v2 title and four MPEG frames.
+    """
+    frame = b'TIT2' + struct.pack('>I', 6) + b'\x00\x00' + b'\x00Title'
+    tag = b'ID3\x03\x00\x00' + bytes([0, 0, 0, len(frame)]) + frame
+
+    return tag + (b'\xff\xfb\x90\x64' + b'\x00' * 413) * 4
+
+
+def flac_content():
+    """
+    Method to build a FLAC with only its stream info block of one second.
+    """
+    stream_info = struct.pack('>HH', 4096, 4096) + b'\x00' * 6
+    stream_info += (44100 << 44 | 1 << 41 | 15 << 36 | 44100).to_bytes(8, 'big') + b'\x00' * 16
+
+    return b'fLaC\x80' + len(stream_info).to_bytes(3, 'big') + stream_info
+
+
+def ogg_content():
+    """
+    Method to build an Ogg Vorbis with its identification page and a last page at one second.
+    """
+    identification = b'\x01vorbis' + struct.pack('<IBIiii', 0, 2, 44100, 0, 128000, 0) + b'\xb8\x01'
+
+    def page(granule, sequence, data, header_type):
+        return (
+            b'OggS\x00' + bytes([header_type]) + struct.pack('<qIII', granule, 1, sequence, 0)
+            + bytes([1, len(data)]) + data
+        )
+
+    return page(0, 0, identification, 2) + page(44100, 1, b'\x00' * 10, 4)
+
+
+class AudioFile:
+    """
+    Minimal file object with the attributes used by `AudioMetadataFromContentExtractor`.
+    """
+
+    def __init__(self, buffer, extension, length):
+        self.content_as_buffer = buffer
+        self.extension = extension
+        self.meta = SimpleNamespace()
+        self.length = length
+
+    def __len__(self):
+        return self.length
+
+
+@pytest.mark.parametrize('extension, content, title', [
+    ('mp3', mp3_content(), 'Title'),
+    ('flac', flac_content(), None),
+    ('ogg', ogg_content(), None),
+])
+def test_extract_audio_metadata_from_file_system(tmp_path, extension, content, title):
+    path = tmp_path / f'audio.{extension}'
+    path.write_bytes(content)
+
+    with path.open('rb') as buffer:
+        file_object = AudioFile(buffer, extension, len(content))
+        AudioMetadataFromContentExtractor.extract(file_object, overrider=False)
+
+    assert file_object.meta.samplerate == 44100
+    assert file_object.meta.duration > 0
+    assert getattr(file_object.meta, 'title', None) == title